@@ -1,46 +1,88 @@
 import networkx as nx
 from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
 from utils.domainClasses import Clique
 
 class BacktrackingSearch(SearchAlgorithm):
 
-    def __init__(self, graph: nx.Graph):
+    INSTRUMENTED = True
+
+    def __init__(self, graph: nx.Graph | CompactGraph, initial_clique: Clique | None = None):
         super().__init__(graph)
-        self.max_clique = None
-        self.max_clique_weight = 0
+        # Warm start: a known clique (e.g. from GreedySearch) is the incumbent from the start
+        self.max_clique = initial_clique
+        self.max_clique_weight = initial_clique.weight if initial_clique is not None else 0
         self.performed_operations = 0
+        self.found_weight = 0  # Heaviest clique reached by the search itself
+        self.warm_start_prunes = 0  # Branches pruned only thanks to the initial clique
+        self.weights = self.compact.weight_list
+        self.adjacency = self.compact.adjacency_masks
 
     def perform_search(self) -> tuple[Clique | None, int, int]:
         # Sort vertices by weight descending to prioritize higher weights first
-        vertices_sorted = sorted(self.graph.nodes, key=lambda v: self.graph.nodes[v]['weight'], reverse=True)
-        self._backtrack([], 0, vertices_sorted)
+        self._backtrack([], 0, self.compact.weight_order)
         
         # Return the maximum clique found, number of operations, and number of solutions tested
         tested_solutions = 1  # In backtracking, we count only the final max clique as one solution
         return self.max_clique, self.performed_operations, tested_solutions
 
     def _backtrack(self, current_clique, current_weight, candidates):
+        probe = self.instrumentation
+        if probe is not None:
+            probe.node(len(current_clique))
+
         # If no candidates remain, we reached the end of this branch
         if not candidates:
+            if current_weight > self.found_weight:
+                self.found_weight = current_weight
             if current_weight > self.max_clique_weight:
+                if probe is not None:
+                    probe.incumbent(current_weight)
                 self.max_clique_weight = current_weight
-                self.max_clique = Clique(vertices=current_clique[:], weight=current_weight)
+                self.max_clique = Clique(vertices=[self.compact.nodes[v] for v in current_clique], weight=current_weight)
+            return
+
+        # Stop expanding when the time limit is over, keeping the best clique found so far
+        if self.deadline_reached():
             return
         
         # Prune the branch if the maximum possible weight is less than max found
-        max_possible_weight = current_weight + sum(self.graph.nodes[v]['weight'] for v in candidates)
+        max_possible_weight = current_weight + sum(self.weights[v] for v in candidates)
         if max_possible_weight <= self.max_clique_weight:
+            if max_possible_weight > self.found_weight:
+                self.warm_start_prunes += 1
+            if probe is not None:
+                probe.bound_prunes += 1
             return
 
+        adjacency = self.adjacency
+
         # Try including each candidate vertex one by one
         for i, vertex in enumerate(candidates):
             new_clique = current_clique + [vertex]
-            new_weight = current_weight + self.graph.nodes[vertex]['weight']
+            new_weight = current_weight + self.weights[vertex]
             self.performed_operations += 1  # Count this operation
             
             # Filter the remaining candidates to those connected to the current clique
-            new_candidates = [v for v in candidates[i + 1:] if all(self.graph.has_edge(v, u) for u in new_clique)]
+            if probe is None:
+                new_candidates = [v for v in candidates[i + 1:] if all(adjacency[v] >> u & 1 for u in new_clique)]
+            else:
+                new_candidates = self._counted_candidates(candidates[i + 1:], new_clique, probe)
             
             # Recursive call to expand the clique further
             self._backtrack(new_clique, new_weight, new_candidates)
+            if self.timed_out:
+                return
 
+    def _counted_candidates(self, candidates, clique, probe):
+        """The candidates connected to the whole clique, counting each adjacency check in `probe`."""
+        adjacency = self.adjacency
+        new_candidates = []
+        for v in candidates:
+            for u in clique:
+                probe.adjacency_checks += 1
+                if not adjacency[v] >> u & 1:
+                    break
+            else:
+                new_candidates.append(v)
+        return new_candidates
@@ -0,0 +1,116 @@
+import time
+import networkx as nx
+from algorithms.nativeKernel import cliqueKernel, pack_graph, time_limit_argument, use_native
+from algorithms.bitsetSearch import BitsetSearch
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Bitset variant of the Backtracking algorithm.
+#
+# Vertices are sorted by weight (descending) and each one gets a position in that order.
+# The neighborhood of every vertex is stored as a Python integer where bit i is set when the
+# vertex at position i is a neighbor. The candidate set of a node of the search tree is also
+# a bitmask, so narrowing the candidates after adding a vertex to the clique is a single AND
+# with that vertex's neighborhood instead of one `has_edge` per clique member.
+#
+# Candidates are expanded in the same order as in BacktrackingSearch, so the returned clique is
+# the same. The only addition is that the bound is also checked while iterating over the
+# candidates of a node (the remaining weight only decreases as candidates are consumed), which
+# cuts branches that BacktrackingSearch would still visit.
+#
+# With backend="native" (or "auto" when it is built) the search runs in the native kernel
+# (see algorithms/nativeKernel.py), which gives the same clique and Ops_Count.
+
+
+class BitsetBacktrackingSearch(BitsetSearch):
+
+    INSTRUMENTED = True
+
+    def __init__(self, graph: nx.Graph | CompactGraph, initial_clique: Clique | None = None, backend: str = "auto"):
+        super().__init__(graph)
+        self.native = use_native(backend)
+        # Warm start: a known clique (e.g. from GreedySearch) is the incumbent from the start
+        self.max_clique = initial_clique
+        self.max_clique_weight = initial_clique.weight if initial_clique is not None else 0
+        self.performed_operations = 0
+        self.found_weight = 0  # Heaviest clique reached by the search itself
+        self.warm_start_prunes = 0  # Branches pruned only thanks to the initial clique
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        if self.native and self.instrumentation is None:  # The native kernel has no counters
+            return self._perform_native_search()
+
+        all_candidates = (1 << len(self.order)) - 1
+        self._expand([], 0, all_candidates)
+
+        # Return the maximum clique found, number of operations, and number of solutions tested
+        tested_solutions = 1  # In backtracking, we count only the final max clique as one solution
+        return self.max_clique, self.performed_operations, tested_solutions
+
+    def _perform_native_search(self) -> tuple[Clique | None, int, int]:
+        time_limit = None if self.deadline is None else self.deadline - time.perf_counter()
+        weight, clique, operations, warm_start_prunes, self.timed_out = cliqueKernel.backtrack(
+            *pack_graph(self.weights, self.adjacency), self.max_clique_weight, time_limit_argument(time_limit))
+
+        self.performed_operations += operations
+        self.warm_start_prunes += warm_start_prunes
+        if clique is not None:
+            self.max_clique_weight = weight
+            self.max_clique = Clique(vertices=[self.order[i] for i in clique], weight=weight)
+        return self.max_clique, self.performed_operations, 1
+
+    def _expand(self, current_clique, current_weight, candidates):
+        probe = self.instrumentation
+        if probe is not None:
+            probe.node(len(current_clique))
+
+        # If no candidates remain, we reached the end of this branch
+        if not candidates:
+            if current_weight > self.found_weight:
+                self.found_weight = current_weight
+            if current_weight > self.max_clique_weight:
+                if probe is not None:
+                    probe.incumbent(current_weight)
+                self.max_clique_weight = current_weight
+                self.max_clique = Clique(vertices=[self.order[i] for i in current_clique], weight=current_weight)
+            return
+
+        # Stop expanding when the time limit is over, keeping the best clique found so far
+        if self.deadline_reached():
+            return
+
+        # Prune the branch if the maximum possible weight is less than max found
+        remaining_weight = self._mask_weight(candidates)
+        if current_weight + remaining_weight <= self.max_clique_weight:
+            if current_weight + remaining_weight > self.found_weight:
+                self.warm_start_prunes += 1
+            if probe is not None:
+                probe.bound_prunes += 1
+            return
+
+        weights = self.weights
+        adjacency = self.adjacency
+
+        # Try including each candidate vertex one by one, highest weight (lowest position) first
+        while candidates:
+            if current_weight + remaining_weight <= self.max_clique_weight:
+                if current_weight + remaining_weight > self.found_weight:
+                    self.warm_start_prunes += 1
+                if probe is not None:
+                    probe.bound_prunes += 1
+                return
+
+            low_bit = candidates & -candidates
+            vertex = low_bit.bit_length() - 1
+            candidates ^= low_bit
+            remaining_weight -= weights[vertex]
+            self.performed_operations += 1  # Count this operation
+
+            # The remaining candidates connected to the new vertex are connected to the whole clique
+            current_clique.append(vertex)
+            if probe is not None:
+                probe.adjacency_checks += 1  # One bitset row
+            self._expand(current_clique, current_weight + weights[vertex], candidates & adjacency[vertex])
+            current_clique.pop()
+            if self.timed_out:
+                return
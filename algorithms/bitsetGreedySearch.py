@@ -0,0 +1,88 @@
+import time
+import networkx as nx
+from algorithms.nativeKernel import cliqueKernel, pack_graph, time_limit_argument, use_native
+from algorithms.bitsetSearch import BitsetSearch
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Bitset variant of the Greedy algorithm.
+#
+# The vertices are sorted by weight (descending) only once, and each one gets its position in
+# that order. Candidate sets are bitmasks over those positions, so:
+#
+# - the heaviest candidate is the lowest set bit of the mask (no `max` over the candidates);
+# - adding a vertex intersects the candidates with its neighborhood with a single AND.
+#
+# The candidates are always the common neighbors of the whole clique, so the adjacency check
+# of GreedySearch against every clique member always succeeds and is skipped here. Operations
+# are still counted as one per clique member checked, so Ops_Count stays comparable with
+# GreedySearch. Ties between equal weights are broken by the lowest vertex index.
+#
+# With backend="native" (or "auto" when it is built) the search runs in the native kernel
+# (see algorithms/nativeKernel.py), which gives the same clique and Ops_Count.
+
+
+class BitsetGreedySearch(BitsetSearch):
+
+    INSTRUMENTED = True
+
+    def __init__(self, graph: nx.Graph | CompactGraph, backend: str = "auto"):
+        super().__init__(graph)
+        self.native = use_native(backend)
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        if self.native and self.instrumentation is None:  # The native kernel has no counters
+            return self._perform_native_search()
+
+        performed_operations = 0
+        tested_solutions = 1  # Initialize with 1, as we only count the final clique as one solution
+        max_clique = None
+        max_clique_weight = 0
+
+        weights = self.weights
+        adjacency = self.adjacency
+        probe = self.instrumentation
+
+        # Start from every vertex, highest weight (lowest position) first
+        for starting_vertex in range(len(weights)):
+            # Stop when the time limit is over, keeping the best clique found so far
+            if self.deadline_reached():
+                break
+
+            current_clique = [starting_vertex]
+            current_weight = weights[starting_vertex]
+            candidates = adjacency[starting_vertex]
+            if probe is not None:
+                probe.node(1)
+                probe.adjacency_checks += 1  # One bitset row
+
+            # Expand clique with the heaviest common neighbor until there is none left
+            while candidates:
+                best_candidate = (candidates & -candidates).bit_length() - 1
+                performed_operations += len(current_clique)  # Same count as the edge checks of GreedySearch
+
+                current_clique.append(best_candidate)
+                current_weight += weights[best_candidate]
+                candidates &= adjacency[best_candidate]
+                if probe is not None:
+                    probe.node(len(current_clique))
+                    probe.adjacency_checks += 1
+
+            # Update max clique if the current clique has a higher weight
+            if current_weight > max_clique_weight:
+                if probe is not None:
+                    probe.incumbent(current_weight)
+                max_clique_weight = current_weight
+                max_clique = Clique(vertices=[self.order[v] for v in current_clique], weight=current_weight)
+
+        return max_clique, performed_operations, tested_solutions
+
+    def _perform_native_search(self) -> tuple[Clique | None, int, int]:
+        time_limit = None if self.deadline is None else self.deadline - time.perf_counter()
+        weight, clique, performed_operations, self.timed_out = cliqueKernel.greedy(
+            *pack_graph(self.weights, self.adjacency), time_limit_argument(time_limit))
+
+        max_clique = None
+        if clique is not None:
+            max_clique = Clique(vertices=[self.order[v] for v in clique], weight=weight)
+        return max_clique, performed_operations, 1
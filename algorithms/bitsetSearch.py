@@ -0,0 +1,33 @@
+import networkx as nx
+from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
+
+# Common base of the searches over bitsets in weight order.
+#
+# Vertices are sorted by weight (descending, ties by the lowest index) and each one gets its
+# position in that order. Sets of vertices are Python integers where bit i stands for the vertex
+# at position i, so the heaviest vertex of a set is its lowest set bit. The order and the bitset
+# rows are shared by all the searches on the same CompactGraph (see graph/compactGraph.py).
+
+
+class BitsetSearch(SearchAlgorithm):
+
+    def __init__(self, graph: nx.Graph | CompactGraph):
+        super().__init__(graph)
+
+        # Position -> vertex, position -> weight and position -> neighborhood bitmask
+        weights = self.compact.weight_list
+        vertices = self.compact.weight_order
+        self.order = [self.compact.nodes[v] for v in vertices]
+        self.weights = [weights[v] for v in vertices]
+        self.adjacency = self.compact.weight_order_masks
+
+    def _mask_weight(self, mask: int) -> int:
+        """Sum of the weights of the vertices whose positions are set in `mask`."""
+        weights = self.weights
+        total = 0
+        while mask:
+            low_bit = mask & -mask
+            total += weights[low_bit.bit_length() - 1]
+            mask ^= low_bit
+        return total
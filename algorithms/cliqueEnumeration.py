@@ -0,0 +1,216 @@
+import heapq
+import networkx as nx
+from typing import Iterator
+from algorithms.bitsetSearch import BitsetSearch
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Enumeration of maximal cliques (Bron–Kerbosch with pivoting), and of all the cliques, on the
+# bitsets of BitsetSearch.
+#
+# Every node of the search keeps the clique R, the candidates P (vertices that extend R) and
+# the excluded vertices X (vertices that extend R but were already explored in a sibling
+# branch). R is a maximal clique when P and X are both empty.
+#
+# 1. Choose as pivot the vertex u of P ∪ X with the most neighbors in P. Every maximal clique
+#    contains u or a non-neighbor of u, so only the candidates that are not neighbors of u are
+#    branched on.
+#
+# 2. Branch on each of those vertices v: R + v, with P and X restricted to the neighbors of v.
+#    Afterwards v moves from P to X.
+#
+# 3. Weight pruning: the cliques below a node weigh at most w(R) + w(P), so the node is skipped
+#    when that cannot reach the minimum weight. For the top-k search, the minimum weight is
+#    raised to just above the k-th best weight as soon as k cliques are known.
+#
+# Weights are integers and all positive, so the maximum weight clique is always a maximal clique
+# and perform_search() returns it. For k > 1, the k heaviest *maximal* cliques are not the k
+# heaviest cliques: the subsets of a maximal clique are cliques too, and can be heavier than the
+# other maximal cliques. heaviest_maximal_cliques(k) only lists maximal cliques.
+#
+# The k heaviest cliques of any kind (heaviest_cliques(k), and `top_cliques`, filled by
+# perform_search with top_k > 0, as in ExhaustiveSearch) come from a plain backtracking over the
+# cliques, without pivot nor excluded set: a node with clique R branches on each candidate v in
+# weight order, with the candidates after v that are neighbors of v, so every clique is reached
+# exactly once. The same weight pruning applies (w(R) + w(P) against the k-th best weight), so
+# only the branches that can still enter the top k are explored, instead of every subset of
+# the vertices. Cliques are produced lazily, as soon as they are found.
+
+
+class CliqueEnumeration(BitsetSearch):
+
+    INSTRUMENTED = True
+
+    def __init__(self, graph: nx.Graph | CompactGraph, top_k: int = 0):
+        super().__init__(graph)
+        self.top_k = top_k  # Number of heaviest cliques (maximal or not) to keep in `top_cliques` (0 disables it)
+        self.top_cliques = []
+        self.performed_operations = 0
+        self.tested_solutions = 0
+        self.min_weight = 0  # Cliques lighter than this are pruned (raised by the top-k searches)
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        if self.top_k > 0:
+            self.top_cliques = heaviest = self.heaviest_cliques(self.top_k)
+        else:
+            heaviest = self.heaviest_maximal_cliques(1)
+        return (heaviest[0] if heaviest else None), self.performed_operations, self.tested_solutions
+
+    def iter_cliques(self, min_weight: int = 0) -> Iterator[Clique]:
+        """Lazily generate every clique (maximal or not) weighing at least `min_weight`.
+
+        `performed_operations` (search nodes) and `tested_solutions` (cliques reached) are
+        updated as the generator advances.
+        """
+        self.performed_operations = 0
+        self.tested_solutions = 0
+        self.min_weight = min_weight
+        candidates = (1 << len(self.order)) - 1
+        yield from self._expand_cliques([], 0, candidates, self._mask_weight(candidates))
+
+    def heaviest_cliques(self, k: int, min_weight: int = 0) -> list[Clique]:
+        """The k heaviest cliques, maximal or not (weighing at least `min_weight`), heaviest first."""
+        return self._heaviest(self.iter_cliques(min_weight), k)
+
+    def iter_maximal_cliques(self, min_weight: int = 0) -> Iterator[Clique]:
+        """Lazily generate every maximal clique weighing at least `min_weight`.
+
+        `performed_operations` (search nodes) and `tested_solutions` (maximal cliques reached)
+        are updated as the generator advances.
+        """
+        self.performed_operations = 0
+        self.tested_solutions = 0
+        self.min_weight = min_weight
+        yield from self._expand([], 0, (1 << len(self.order)) - 1, 0)
+
+    def heaviest_maximal_cliques(self, k: int, min_weight: int = 0) -> list[Clique]:
+        """The k heaviest maximal cliques (weighing at least `min_weight`), heaviest first.
+
+        These are not the k heaviest cliques when k > 1 (see heaviest_cliques).
+        """
+        return self._heaviest(self.iter_maximal_cliques(min_weight), k)
+
+    def _heaviest(self, cliques: Iterator[Clique], k: int) -> list[Clique]:
+        """The k heaviest of the `cliques` generated by this search, which prunes with `min_weight`."""
+        top_heap = []  # Min-heap of (weight, -order, clique)
+        for order, clique in enumerate(cliques):
+            if len(top_heap) < k:
+                heapq.heappush(top_heap, (clique.weight, -order, clique))
+            elif clique.weight > top_heap[0][0]:
+                heapq.heapreplace(top_heap, (clique.weight, -order, clique))
+            else:
+                continue
+            if self.instrumentation is not None:  # A clique entered the top k
+                self.instrumentation.incumbent(clique.weight)
+
+            # Only cliques heavier than the k-th best can still enter the heap
+            if len(top_heap) == k:
+                self.min_weight = max(self.min_weight, top_heap[0][0] + 1)
+
+        return [clique for _, _, clique in sorted(top_heap, key=lambda item: item[:2], reverse=True)]
+
+    def _expand(self, current_clique: list[int], current_weight: int, candidates: int, excluded: int) -> Iterator[Clique]:
+        self.performed_operations += 1
+        probe = self.instrumentation
+        if probe is not None:
+            probe.node(len(current_clique))
+
+        # R is maximal: nothing extends it, not even the vertices explored before
+        if not candidates:
+            if not excluded and current_clique:
+                self.tested_solutions += 1
+                if current_weight >= self.min_weight:
+                    yield Clique(vertices=[self.order[i] for i in current_clique], weight=current_weight)
+            return
+
+        # Stop when the time limit is over
+        if self.deadline_reached():
+            return
+
+        # Prune the branch if it cannot reach the minimum weight
+        if current_weight + self._mask_weight(candidates) < self.min_weight:
+            if probe is not None:
+                probe.bound_prunes += 1
+            return
+
+        # Pivot: the vertex of P ∪ X with the most neighbors among the candidates
+        adjacency = self.adjacency
+        pivot_set = candidates | excluded
+        if probe is not None:
+            probe.adjacency_checks += pivot_set.bit_count()  # One bitset row per pivot candidate
+        pivot_neighbors = 0
+        pivot_count = -1
+        while pivot_set:
+            low_bit = pivot_set & -pivot_set
+            pivot_set ^= low_bit
+            neighbors = candidates & adjacency[low_bit.bit_length() - 1]
+            if neighbors.bit_count() > pivot_count:
+                pivot_neighbors, pivot_count = neighbors, neighbors.bit_count()
+
+        # Branch on the candidates that are not neighbors of the pivot, highest weight first
+        branches = candidates & ~pivot_neighbors
+        while branches:
+            low_bit = branches & -branches
+            branches ^= low_bit
+            vertex = low_bit.bit_length() - 1
+
+            current_clique.append(vertex)
+            if probe is not None:
+                probe.adjacency_checks += 1
+            yield from self._expand(current_clique, current_weight + self.weights[vertex],
+                                    candidates & adjacency[vertex], excluded & adjacency[vertex])
+            current_clique.pop()
+            if self.timed_out:
+                return
+
+            candidates ^= low_bit
+            excluded |= low_bit
+
+            # The minimum weight may have been raised by the consumer (top-k)
+            if current_weight + self._mask_weight(candidates) < self.min_weight:
+                if probe is not None:
+                    probe.bound_prunes += 1
+                return
+
+    def _expand_cliques(self, current_clique: list[int], current_weight: int, candidates: int,
+                        candidates_weight: int) -> Iterator[Clique]:
+        self.performed_operations += 1
+        probe = self.instrumentation
+        if probe is not None:
+            probe.node(len(current_clique))
+
+        # Every node (but the root) is a clique
+        if current_clique:
+            self.tested_solutions += 1
+            if current_weight >= self.min_weight:
+                yield Clique(vertices=[self.order[i] for i in current_clique], weight=current_weight)
+
+        # Nothing extends R, or the time limit is over
+        if not candidates or self.deadline_reached():
+            return
+
+        adjacency = self.adjacency
+        weights = self.weights
+        while candidates:
+            # The cliques below weigh at most w(R) + w(P), and the minimum weight may have been
+            # raised by the consumer (top-k) since the last branch
+            if current_weight + candidates_weight < self.min_weight:
+                if probe is not None:
+                    probe.bound_prunes += 1
+                return
+
+            # Branch on the heaviest candidate left; the lighter ones are only combined with it below
+            low_bit = candidates & -candidates
+            candidates ^= low_bit
+            vertex = low_bit.bit_length() - 1
+            candidates_weight -= weights[vertex]
+
+            branch_candidates = candidates & adjacency[vertex]
+            current_clique.append(vertex)
+            if probe is not None:
+                probe.adjacency_checks += 1
+            yield from self._expand_cliques(current_clique, current_weight + weights[vertex], branch_candidates,
+                                            self._mask_weight(branch_candidates))
+            current_clique.pop()
+            if self.timed_out:
+                return
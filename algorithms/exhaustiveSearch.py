@@ -1,12 +1,26 @@
+import heapq
 import networkx as nx
 from itertools import chain, combinations
+from typing import Iterator
 from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
 from utils.domainClasses import Clique
 
 class ExhaustiveSearch(SearchAlgorithm):
 
-    def __init__(self, graph: nx.Graph):
+    INSTRUMENTED = True
+
+    # Number of subsets tested between two checks of the time limit
+    DEADLINE_CHECK_INTERVAL = 4096
+
+    def __init__(self, graph: nx.Graph | CompactGraph, top_k: int = 0):
         super().__init__(graph)
+        self.weights = self.compact.weight_list
+        self.adjacency = self.compact.adjacency_masks
+        self.top_k = top_k  # Number of heaviest cliques (maximal or not) to keep in `top_cliques` (0 disables it)
+        self.top_cliques = []
+        self.performed_operations = 0
+        self.tested_solutions = 0
         # Preprocess the graph to remove isolated vertices
         # self.graph = self.remove_isolated_vertices(graph)
 
@@ -17,33 +31,61 @@ class ExhaustiveSearch(SearchAlgorithm):
     #     return graph
     
     def perform_search(self) -> tuple[Clique | None, int, int]:
-        performed_operations = 0
-        tested_solutions = 0
-        all_cliques_found = []
+        max_clique = None
+        top_heap = []  # Min-heap of (weight, order, clique) with the k heaviest cliques
+
+        # Manter apenas o melhor clique (e opcionalmente os k melhores) em vez de todos os cliques
+        for order, clique in enumerate(self.iter_cliques()):
+            if max_clique is None or clique.weight > max_clique.weight:
+                if self.instrumentation is not None:
+                    self.instrumentation.incumbent(clique.weight)
+                max_clique = clique
+
+            if self.top_k > 0:
+                if len(top_heap) < self.top_k:
+                    heapq.heappush(top_heap, (clique.weight, -order, clique))
+                elif clique.weight > top_heap[0][0]:
+                    heapq.heapreplace(top_heap, (clique.weight, -order, clique))
+
+        self.top_cliques = [clique for _, _, clique in sorted(top_heap, key=lambda item: item[:2], reverse=True)]
+
+        return max_clique, self.performed_operations, self.tested_solutions
+
+    def iter_cliques(self) -> Iterator[Clique]:
+        """Gera, de forma preguiçosa, todos os cliques (não vazios) do grafo.
+
+        Os contadores `performed_operations` e `tested_solutions` são atualizados à medida que
+        os subconjuntos são testados, pelo que só ficam completos quando o gerador termina.
+        """
+        self.performed_operations = 0
+        self.tested_solutions = 0
 
         # Gerar todos os subconjuntos de vértices, incluindo o vazio
-        all_vertex_subsets = chain.from_iterable(combinations(self.graph.nodes, r) for r in range(len(self.graph.nodes) + 1))
+        num_vertices = self.compact.number_of_nodes()
+        all_vertex_subsets = chain.from_iterable(combinations(range(num_vertices), r) for r in range(num_vertices + 1))
 
         # Loop sobre todos os subconjuntos para garantir pesquisa exaustiva
+        probe = self.instrumentation
         for vertex_subset in all_vertex_subsets:
-            tested_solutions += 1  # Contabiliza cada subconjunto testado
+            # Parar quando o tempo limite terminar (verificado a cada bloco de subconjuntos)
+            if self.tested_solutions % self.DEADLINE_CHECK_INTERVAL == 0 and self.deadline_reached():
+                return
+
+            self.tested_solutions += 1  # Contabiliza cada subconjunto testado
 
             # Verificar se o subconjunto é um clique e contabilizar cada verificação
             vertice_subset_is_clique, clique_operations = self.is_clique(vertex_subset)
-            performed_operations += clique_operations  # Incrementa operações de verificação de clique
+            self.performed_operations += clique_operations  # Incrementa operações de verificação de clique
+            if probe is not None:
+                probe.node(len(vertex_subset))
+                probe.adjacency_checks += clique_operations  # Um par verificado é um teste de adjacência
 
             if vertice_subset_is_clique and len(vertex_subset) > 0:  # Ignora o clique vazio no resultado final
                 # Calcular o peso do clique
-                clique_weight = sum(self.graph.nodes[node]['weight'] for node in vertex_subset)
-                performed_operations += 1  # Incrementa operação de soma de pesos
-
-                new_clique = Clique(vertices=list(vertex_subset), weight=clique_weight)
-                all_cliques_found.append(new_clique)
-
-        # Selecionar o clique com o peso máximo, sem considerar o vazio
-        max_clique = max(all_cliques_found, key=lambda clique: clique.weight, default=None)
+                clique_weight = sum(self.weights[node] for node in vertex_subset)
+                self.performed_operations += 1  # Incrementa operação de soma de pesos
 
-        return max_clique, performed_operations, tested_solutions
+                yield Clique(vertices=[self.compact.nodes[node] for node in vertex_subset], weight=clique_weight)
 
     def is_clique(self, vertex_subset):
         """Verifica se o subset de vértices forma um clique completo e conta operações detalhadas."""
@@ -61,7 +103,7 @@ class ExhaustiveSearch(SearchAlgorithm):
                 v1, v2 = vertex_subset[i], vertex_subset[j]
 
                 # Verificar se há uma aresta entre v1 e v2
-                if not self.graph.has_edge(v1, v2):
+                if not self.adjacency[v1] >> v2 & 1:
                     return False, clique_operations
 
         return True, clique_operations
@@ -0,0 +1,88 @@
+import time
+import networkx as nx
+from algorithms.backtrackingSearch import BacktrackingSearch
+from algorithms.exhaustiveSearch import ExhaustiveSearch
+from algorithms.greedySearch import GreedySearch
+from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Greedy, Backtracking (and optionally Exhaustive) in one run over the same instance.
+#
+# 1. All the searches are given the same CompactGraph, so the structures they need (weight list,
+#    bitset rows, vertices sorted by weight) are built once, by whichever search uses them first,
+#    and then shared (see graph/compactGraph.py).
+#
+# 2. Run the Greedy search, then the Backtracking search with the greedy clique as its initial
+#    incumbent (warm start), so it only has to look for heavier cliques.
+#
+# 3. With FusedExhaustiveSearch, also run the Exhaustive search on the instances with at most
+#    `exhaustive_max_vertices` vertices, as a check of the Backtracking result. It gets the time
+#    left, and if it does not finish its columns are left empty (the instance is not timed out).
+#
+# The result (clique, Ops_Count and Tested_Solutions) is the one of the Backtracking search, and
+# the results of the other searches, together with the accuracy of the greedy clique (Delta and
+# Accuracy, as in results/comparison), are reported as extra result columns. This way the
+# comparison is available as soon as each instance finishes, without merging the results files
+# of separate runs. The time limit covers all the searches.
+
+
+class FusedSearch(SearchAlgorithm):
+
+    STATS = ("Greedy_Weight", "Greedy_Ops", "Greedy_Time", "Backtracking_Time", "Warm_Start_Prunes", "Delta", "Accuracy")
+    INSTRUMENTED = True  # The counters add up over all the searches
+
+    def __init__(self, graph: nx.Graph | CompactGraph, exhaustive_max_vertices: int = 0):
+        super().__init__(graph)
+        self.exhaustive_max_vertices = exhaustive_max_vertices
+        self.stats = {}
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        self.stats = {}
+
+        _, greedy_clique = self._run(GreedySearch(self.compact), "Greedy")
+        backtracking, max_clique = self._run(BacktrackingSearch(self.compact, initial_clique=greedy_clique), "Backtracking")
+        self.stats["Warm_Start_Prunes"] = backtracking.warm_start_prunes
+
+        greedy_weight = greedy_clique.weight if greedy_clique is not None else 0
+        max_weight = max_clique.weight if max_clique is not None else 0
+        self.stats["Delta"] = max_weight - greedy_weight
+        self.stats["Accuracy"] = greedy_weight / max_weight * 100 if max_weight else 100.0
+
+        # The exhaustive check is left empty when it is skipped or does not finish in time
+        exhaustive = None
+        if self.compact.number_of_nodes() <= self.exhaustive_max_vertices and not self.timed_out:
+            exhaustive, _ = self._run(ExhaustiveSearch(self.compact), "Exhaustive")
+        if "Exhaustive_Weight" in self.STATS and (exhaustive is None or exhaustive.timed_out):
+            self.stats.update(Exhaustive_Weight="", Exhaustive_Ops="", Exhaustive_Time="")
+
+        return max_clique, backtracking.performed_operations, 1
+
+    def _run(self, algorithm: SearchAlgorithm, name: str) -> tuple[SearchAlgorithm, Clique | None]:
+        """Run `algorithm` with the time left and record its weight, operations and time."""
+        algorithm.set_time_limit(self.deadline - time.perf_counter() if self.deadline is not None else None)
+        if self.instrumentation is not None:
+            algorithm.instrument(self.instrumentation)
+
+        start_time_search = time.perf_counter()
+        clique, operations, _ = algorithm.perform_search()
+        search_time = time.perf_counter() - start_time_search
+
+        if name != "Backtracking":
+            self.stats[f"{name}_Weight"] = clique.weight if clique is not None else 0
+            self.stats[f"{name}_Ops"] = operations
+        self.stats[f"{name}_Time"] = search_time
+        if algorithm.timed_out and name != "Exhaustive":
+            self.timed_out = True
+        return algorithm, clique
+
+    def search_stats(self) -> dict:
+        return self.stats
+
+
+class FusedExhaustiveSearch(FusedSearch):
+
+    STATS = FusedSearch.STATS + ("Exhaustive_Weight", "Exhaustive_Ops", "Exhaustive_Time")
+
+    def __init__(self, graph: nx.Graph | CompactGraph, exhaustive_max_vertices: int = 20):
+        super().__init__(graph, exhaustive_max_vertices)
@@ -1,5 +1,6 @@
 import networkx as nx
 from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
 from utils.domainClasses import Clique
 
 # The implemented Greedy algorithm can be described briefly using the following sequence of steps:
@@ -28,8 +29,13 @@ from utils.domainClasses import Clique
 
 class GreedySearch(SearchAlgorithm):
 
-    def __init__(self, graph: nx.Graph):
+    INSTRUMENTED = True
+
+    def __init__(self, graph: nx.Graph | CompactGraph):
         super().__init__(graph)
+        self.weights = self.compact.weight_list
+        self.adjacency = self.compact.adjacency_masks
+        self.neighbors = [self.compact.neighbors(v).tolist() for v in range(self.compact.number_of_nodes())]
 
     def perform_search(self) -> tuple[Clique | None, int, int]:
         performed_operations = 0
@@ -38,55 +44,70 @@ class GreedySearch(SearchAlgorithm):
         max_clique_weight = 0
 
         # Start with the highest-weight vertex as the first candidate for the clique
-        vertices_sorted = sorted(self.graph.nodes, key=lambda v: self.graph.nodes[v]['weight'], reverse=True)
-        for starting_vertex in vertices_sorted:
+        weights = self.weights
+        adjacency = self.adjacency
+        probe = self.instrumentation
+        for starting_vertex in self.compact.weight_order:
+            # Stop when the time limit is over, keeping the best clique found so far
+            if self.deadline_reached():
+                break
+
             current_clique = [starting_vertex]
-            current_weight = self.graph.nodes[starting_vertex]['weight']
-            candidates = set(self.graph.neighbors(starting_vertex))
+            current_weight = weights[starting_vertex]
+            candidates = set(self.neighbors[starting_vertex])
+            if probe is not None:
+                probe.node(1)
 
             # Expand clique
             while candidates:
-                best_candidate = max(candidates, key=lambda v: self.graph.nodes[v]['weight'])
-                is_valid = all(self.graph.has_edge(best_candidate, node) for node in current_clique)
+                best_candidate = max(candidates, key=lambda v: (weights[v], -v))  # Ties go to the lowest index
+                is_valid = all(adjacency[best_candidate] >> node & 1 for node in current_clique)
                 performed_operations += len(current_clique)  # Count operations for each edge check
+                if probe is not None:
+                    probe.adjacency_checks += len(current_clique)  # Candidates are common neighbors, all() checks every vertex
 
                 if is_valid:
                     current_clique.append(best_candidate)
-                    current_weight += self.graph.nodes[best_candidate]['weight']
-                    candidates = candidates.intersection(self.graph.neighbors(best_candidate))
+                    if probe is not None:
+                        probe.node(len(current_clique))
+                    current_weight += weights[best_candidate]
+                    candidates = candidates.intersection(self.neighbors[best_candidate])
                 else:
                     candidates.remove(best_candidate)
 
             # Update max clique if the current clique has a higher weight
             if current_weight > max_clique_weight:
+                if probe is not None:
+                    probe.incumbent(current_weight)
                 max_clique_weight = current_weight
-                max_clique = Clique(vertices=current_clique, weight=current_weight)
+                max_clique = Clique(vertices=[self.compact.nodes[v] for v in current_clique], weight=current_weight)
 
         return max_clique, performed_operations, tested_solutions
 
 
     def build_greedy_clique(self, starting_vertex) -> tuple[list[int], int, int]:
-        """Constrói um clique começando do vértice inicial com base na heurística Greedy."""
+        """Constrói um clique começando do vértice inicial (índice no CompactGraph) com base na heurística Greedy."""
+        weights = self.weights
         clique = [starting_vertex]
-        clique_weight = self.graph.nodes[starting_vertex]['weight']
+        clique_weight = weights[starting_vertex]
         operations = 1  # Inicializa com uma operação para somar o peso do vértice inicial
 
         # Obter vizinhos do vértice inicial
-        candidates = set(self.graph.neighbors(starting_vertex))
+        candidates = set(self.neighbors[starting_vertex])
 
         while candidates:
             # Selecionar o vizinho com o maior peso
-            next_vertex = max(candidates, key=lambda v: self.graph.nodes[v]['weight'])
+            next_vertex = max(candidates, key=lambda v: (weights[v], -v))
             operations += 1  # Contabiliza a operação de seleção do próximo vértice
 
             # Verificar se o próximo vértice é adjacente a todos os vértices do clique atual
-            if all(self.graph.has_edge(next_vertex, v) for v in clique):
+            if all(self.adjacency[next_vertex] >> v & 1 for v in clique):
                 clique.append(next_vertex)
-                clique_weight += self.graph.nodes[next_vertex]['weight']
+                clique_weight += weights[next_vertex]
                 operations += len(clique)  # Incrementa as operações para verificar a adjacência
 
                 # Atualizar candidatos para incluir apenas vizinhos comuns
-                candidates.intersection_update(self.graph.neighbors(next_vertex))
+                candidates.intersection_update(self.neighbors[next_vertex])
             else:
                 candidates.remove(next_vertex)
                 operations += 1  # Conta a operação de remoção do candidato
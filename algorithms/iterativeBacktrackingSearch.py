@@ -0,0 +1,104 @@
+import networkx as nx
+from algorithms.bitsetBacktrackingSearch import BitsetBacktrackingSearch
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Non-recursive version of the Backtracking algorithm.
+#
+# The search tree is walked with an explicit stack instead of recursion. The stack is made of
+# lists preallocated with one slot per depth (a clique never has more than n vertices):
+#
+# - candidates_at[d]: bitmask of the candidates still to try at depth d
+# - weight_at[d]: weight of the clique at depth d
+# - clique[d]: vertex (position in weight order) added at depth d
+#
+# Going down writes the slots of the next depth, and going back up just lowers the depth, so
+# no lists are created while searching and siblings reuse the same slots. Candidate sets are
+# bitsets over the vertices sorted by weight, as in BitsetBacktrackingSearch.
+#
+# Nodes are visited, bounded and counted exactly as in BacktrackingSearch (the bound is only
+# checked when a node is entered), so the returned clique and the number of operations are the
+# same. There is no recursion, so the depth is not limited by the recursion limit.
+
+
+class IterativeBacktrackingSearch(BitsetBacktrackingSearch):
+
+    def __init__(self, graph: nx.Graph | CompactGraph, initial_clique: Clique | None = None):
+        super().__init__(graph, initial_clique, backend="python")
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        num_vertices = len(self.order)
+        weights = self.weights
+        adjacency = self.adjacency
+
+        candidates_at = [0] * (num_vertices + 1)
+        weight_at = [0] * (num_vertices + 1)
+        clique = [0] * num_vertices
+
+        # Node being entered: its depth, candidates and clique weight (starting at the root)
+        depth = 0
+        candidates = (1 << num_vertices) - 1
+        current_weight = 0
+        probe = self.instrumentation
+
+        while True:
+            expand = False
+            if probe is not None:
+                probe.node(depth)
+
+            # If no candidates remain, we reached the end of this branch
+            if not candidates:
+                if current_weight > self.found_weight:
+                    self.found_weight = current_weight
+                if current_weight > self.max_clique_weight:
+                    if probe is not None:
+                        probe.incumbent(current_weight)
+                    self.max_clique_weight = current_weight
+                    self.max_clique = Clique(vertices=[self.order[v] for v in clique[:depth]], weight=current_weight)
+
+            # Stop when the time limit is over, keeping the best clique found so far
+            elif self.deadline_reached():
+                break
+
+            # Prune the branch if the maximum possible weight is not above the max found
+            else:
+                max_possible_weight = current_weight + self._mask_weight(candidates)
+                if max_possible_weight > self.max_clique_weight:
+                    expand = True
+                else:
+                    if max_possible_weight > self.found_weight:
+                        self.warm_start_prunes += 1
+                    if probe is not None:
+                        probe.bound_prunes += 1
+
+            if expand:
+                candidates_at[depth] = candidates
+                weight_at[depth] = current_weight
+            else:
+                depth -= 1  # Back to the parent
+
+            # Go up while the nodes have no candidates left to try
+            while depth >= 0 and not candidates_at[depth]:
+                depth -= 1
+            if depth < 0:
+                break
+
+            # Next candidate of the node at this depth, highest weight (lowest position) first
+            remaining = candidates_at[depth]
+            low_bit = remaining & -remaining
+            vertex = low_bit.bit_length() - 1
+            remaining ^= low_bit
+            candidates_at[depth] = remaining
+            self.performed_operations += 1  # Count this operation
+
+            # Enter the child: the later candidates connected to the new vertex
+            clique[depth] = vertex
+            if probe is not None:
+                probe.adjacency_checks += 1  # One bitset row
+            candidates = remaining & adjacency[vertex]
+            current_weight = weight_at[depth] + weights[vertex]
+            depth += 1
+
+        # Return the maximum clique found, number of operations, and number of solutions tested
+        tested_solutions = 1  # In backtracking, we count only the final max clique as one solution
+        return self.max_clique, self.performed_operations, tested_solutions
@@ -0,0 +1,140 @@
+import time
+from itertools import count
+import numpy as np
+import networkx as nx
+from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
+from graph.generateGraph import N_MEC
+from utils.domainClasses import Clique
+
+# Anytime tabu local search for the maximum weight clique (multi-neighborhood, MN/TS style).
+#
+# The search walks through cliques, one move at a time, and remembers the heaviest one seen:
+#
+# - ADD: a vertex adjacent to every vertex of the clique joins it (always preferred, heaviest first).
+# - SWAP: a vertex adjacent to all but one vertex of the clique joins it and that vertex leaves.
+# - DROP: a vertex leaves the clique.
+#
+# When no ADD is possible, the best SWAP (largest weight gain) or DROP (smallest weight loss) is
+# made, even if the clique gets lighter, which lets the search escape local optima. A vertex that
+# leaves the clique is tabu (it cannot come back) for `tabu_tenure` iterations, unless adding it
+# gives a new best clique (aspiration). After `restart_after` iterations without improvement the
+# clique is emptied and the search restarts from a random vertex.
+#
+# For every vertex outside the clique the search keeps how many clique vertices it is NOT
+# adjacent to (`missing`) and the sum of their indices (`conflicts`): ADD candidates have
+# missing == 0, SWAP candidates have missing == 1, and for those `conflicts` is exactly the
+# vertex that has to leave. Both arrays are updated with NumPy on every move, in O(n).
+#
+# The search stops after `max_iterations` moves (None for no limit), after `time_budget` seconds,
+# or when the time limit of the run is reached, and returns the best clique found so far. The result is not
+# guaranteed to be optimal, but the search scales to graphs with thousands of vertices.
+
+
+class LocalSearch(SearchAlgorithm):
+
+    def __init__(self, graph: nx.Graph | CompactGraph, max_iterations: int | None = 10_000, time_budget: float | None = None,
+                 tabu_tenure: int = 7, restart_after: int = 1_000, seed: int = N_MEC):
+        super().__init__(graph)
+        self.max_iterations = max_iterations
+        self.time_budget = time_budget  # Seconds (None for no budget other than the iterations)
+        self.tabu_tenure = tabu_tenure
+        self.restart_after = restart_after
+        self.seed = seed
+        self.weights = self.compact.weights
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        num_vertices = self.compact.number_of_nodes()
+        if num_vertices == 0:
+            return None, 0, 0
+
+        budget_end = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        rng = np.random.default_rng(self.seed)
+        weights = self.weights
+
+        performed_operations = 0
+        tested_solutions = 0
+        max_clique_vertices = None
+        max_clique_weight = 0
+
+        self._reset(num_vertices)
+        tabu_until = np.zeros(num_vertices, dtype=np.int64)  # Iteration until which each vertex cannot be added
+        iterations_without_improvement = 0
+
+        for iteration in (range(self.max_iterations) if self.max_iterations is not None else count()):
+            if self.deadline_reached() or (budget_end is not None and time.perf_counter() >= budget_end):
+                break
+
+            outside = ~self.in_clique
+            allowed = outside & (tabu_until <= iteration)
+            aspiring = outside & (self.missing == 0) & (self.clique_weight + weights > max_clique_weight)
+            adds = np.flatnonzero((allowed & (self.missing == 0)) | aspiring)
+            swaps = np.flatnonzero(allowed & (self.missing == 1))
+            members = np.flatnonzero(self.in_clique)
+            performed_operations += len(adds) + len(swaps) + len(members)
+
+            if len(adds):
+                self._add(adds[np.argmax(weights[adds])])
+            elif len(swaps) or len(members):
+                # Best swap (largest gain) against best drop (lightest vertex of the clique)
+                swap_gains = weights[swaps] - weights[self.conflicts[swaps]]
+                lightest = members[np.argmin(weights[members])] if len(members) else None
+                if len(swaps) and (lightest is None or swap_gains.max() >= -weights[lightest]):
+                    best_swap = np.argmax(swap_gains)
+                    leaving = self.conflicts[swaps[best_swap]]
+                    self._drop(leaving)
+                    self._add(swaps[best_swap])
+                else:
+                    leaving = lightest
+                    self._drop(leaving)
+                tabu_until[leaving] = iteration + self.tabu_tenure
+            else:
+                # Every vertex is tabu and the clique is empty
+                iterations_without_improvement = self.restart_after
+
+            tested_solutions += 1
+
+            if self.clique_weight > max_clique_weight:
+                max_clique_weight = int(self.clique_weight)
+                max_clique_vertices = np.flatnonzero(self.in_clique)
+                iterations_without_improvement = 0
+            else:
+                iterations_without_improvement += 1
+
+            # Restart from a random vertex when the search stagnates
+            if iterations_without_improvement >= self.restart_after:
+                self._reset(num_vertices)
+                tabu_until[:] = 0
+                self._add(int(rng.integers(num_vertices)))
+                iterations_without_improvement = 0
+
+        max_clique = None
+        if max_clique_vertices is not None:
+            max_clique = Clique(vertices=[self.compact.nodes[v] for v in max_clique_vertices.tolist()], weight=max_clique_weight)
+        return max_clique, performed_operations, tested_solutions
+
+    def _reset(self, num_vertices: int):
+        self.in_clique = np.zeros(num_vertices, dtype=bool)
+        self.missing = np.zeros(num_vertices, dtype=np.int64)  # Clique vertices each vertex is not adjacent to
+        self.conflicts = np.zeros(num_vertices, dtype=np.int64)  # Sum of the indices of those vertices
+        self.clique_weight = 0
+
+    def _add(self, vertex: int):
+        self._update_conflicts(vertex, 1)
+        self.in_clique[vertex] = True
+        self.clique_weight += self.weights[vertex]
+
+    def _drop(self, vertex: int):
+        self._update_conflicts(vertex, -1)
+        self.in_clique[vertex] = False
+        self.clique_weight -= self.weights[vertex]
+
+    def _update_conflicts(self, vertex: int, sign: int):
+        # Every vertex except `vertex` itself and its neighbors is not adjacent to it
+        neighbors = self.compact.neighbors(vertex)
+        self.missing += sign
+        self.missing[neighbors] -= sign
+        self.missing[vertex] -= sign
+        self.conflicts += sign * vertex
+        self.conflicts[neighbors] -= sign * vertex
+        self.conflicts[vertex] -= sign * vertex
@@ -0,0 +1,306 @@
+/*
+ * Native kernel of the bitset Greedy and Backtracking searches.
+ *
+ * Same algorithms as BitsetGreedySearch.perform_search and BitsetBacktrackingSearch._expand,
+ * on the same data: the vertices are positions 0 .. n-1 in descending weight order, and the
+ * neighborhood of each position is a row of `words` 64-bit words (bit i of the row is set when
+ * position i is a neighbor). Rows are passed as one bytes object with the n rows one after the
+ * other, little-endian, and the weights as a bytes object of n int64 values.
+ *
+ * Both searches visit the vertices in the same order, bound and count operations in the same
+ * way as the Python versions, so they return the same clique and operation count.
+ *
+ * Build with: python setup.py build_ext --inplace
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+#include <time.h>
+
+/* Number of search nodes between two checks of the time limit */
+#define DEADLINE_CHECK_INTERVAL 1024
+
+typedef struct {
+    Py_ssize_t n;
+    Py_ssize_t words;
+    const int64_t *weights;
+    const uint64_t *adjacency;
+
+    uint64_t *candidates;    /* (n + 1) rows of candidates, one per depth */
+    Py_ssize_t *clique;      /* vertex added at each depth */
+    Py_ssize_t *best_clique;
+    Py_ssize_t best_size;
+
+    int64_t best_weight;
+    int64_t found_weight;    /* heaviest clique reached by the search itself */
+    long long operations;
+    long long warm_start_prunes;
+
+    double deadline;         /* < 0 when there is no time limit */
+    long long nodes;
+    int timed_out;
+} Search;
+
+static double now(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static int deadline_reached(Search *s)
+{
+    if (s->deadline >= 0 && !s->timed_out && ++s->nodes % DEADLINE_CHECK_INTERVAL == 0 && now() >= s->deadline)
+        s->timed_out = 1;
+    return s->timed_out;
+}
+
+static int is_empty(const uint64_t *row, Py_ssize_t words)
+{
+    for (Py_ssize_t w = 0; w < words; w++)
+        if (row[w])
+            return 0;
+    return 1;
+}
+
+/* Lowest set position of the row (the row must not be empty) */
+static Py_ssize_t lowest(const uint64_t *row, Py_ssize_t words)
+{
+    for (Py_ssize_t w = 0; w < words; w++)
+        if (row[w])
+            return w * 64 + __builtin_ctzll(row[w]);
+    return -1;
+}
+
+static int64_t row_weight(const Search *s, const uint64_t *row)
+{
+    int64_t total = 0;
+    for (Py_ssize_t w = 0; w < s->words; w++) {
+        uint64_t bits = row[w];
+        while (bits) {
+            total += s->weights[w * 64 + __builtin_ctzll(bits)];
+            bits &= bits - 1;
+        }
+    }
+    return total;
+}
+
+static void expand(Search *s, Py_ssize_t depth, int64_t current_weight)
+{
+    Py_ssize_t words = s->words;
+    uint64_t *candidates = s->candidates + depth * words;
+    uint64_t *child = candidates + words;
+
+    /* If no candidates remain, we reached the end of this branch */
+    if (is_empty(candidates, words)) {
+        if (current_weight > s->found_weight)
+            s->found_weight = current_weight;
+        if (current_weight > s->best_weight) {
+            s->best_weight = current_weight;
+            s->best_size = depth;
+            memcpy(s->best_clique, s->clique, depth * sizeof(Py_ssize_t));
+        }
+        return;
+    }
+
+    if (deadline_reached(s))
+        return;
+
+    int64_t remaining_weight = row_weight(s, candidates);
+    if (current_weight + remaining_weight <= s->best_weight) {
+        if (current_weight + remaining_weight > s->found_weight)
+            s->warm_start_prunes++;
+        return;
+    }
+
+    while (!is_empty(candidates, words)) {
+        if (current_weight + remaining_weight <= s->best_weight) {
+            if (current_weight + remaining_weight > s->found_weight)
+                s->warm_start_prunes++;
+            return;
+        }
+
+        Py_ssize_t vertex = lowest(candidates, words);
+        candidates[vertex / 64] &= ~((uint64_t)1 << (vertex % 64));
+        remaining_weight -= s->weights[vertex];
+        s->operations++;
+
+        const uint64_t *neighbors = s->adjacency + vertex * words;
+        for (Py_ssize_t w = 0; w < words; w++)
+            child[w] = candidates[w] & neighbors[w];
+
+        s->clique[depth] = vertex;
+        expand(s, depth + 1, current_weight + s->weights[vertex]);
+        if (s->timed_out)
+            return;
+    }
+}
+
+static int parse_graph(Search *s, Py_buffer *weights, Py_buffer *adjacency)
+{
+    s->n = weights->len / (Py_ssize_t)sizeof(int64_t);
+    s->words = (s->n + 63) / 64;
+    if (adjacency->len != s->n * s->words * (Py_ssize_t)sizeof(uint64_t)) {
+        PyErr_SetString(PyExc_ValueError, "adjacency must have n rows of (n + 63) // 64 words");
+        return -1;
+    }
+    s->weights = (const int64_t *)weights->buf;
+    s->adjacency = (const uint64_t *)adjacency->buf;
+    return 0;
+}
+
+static PyObject *clique_list(const Py_ssize_t *clique, Py_ssize_t size)
+{
+    PyObject *list = PyList_New(size);
+    if (list == NULL)
+        return NULL;
+    for (Py_ssize_t i = 0; i < size; i++)
+        PyList_SET_ITEM(list, i, PyLong_FromSsize_t(clique[i]));
+    return list;
+}
+
+/* backtrack(weights, adjacency, initial_weight, time_limit)
+ *     -> (best_weight, clique positions or None, operations, warm_start_prunes, timed_out) */
+static PyObject *backtrack(PyObject *self, PyObject *args)
+{
+    Py_buffer weights, adjacency;
+    long long initial_weight;
+    double time_limit;
+    if (!PyArg_ParseTuple(args, "y*y*Ld", &weights, &adjacency, &initial_weight, &time_limit))
+        return NULL;
+
+    Search s;
+    memset(&s, 0, sizeof(s));
+    PyObject *result = NULL;
+    if (parse_graph(&s, &weights, &adjacency) < 0)
+        goto done;
+
+    s.candidates = PyMem_Calloc((s.n + 2) * s.words + 1, sizeof(uint64_t));
+    s.clique = PyMem_Calloc(s.n + 1, sizeof(Py_ssize_t));
+    s.best_clique = PyMem_Calloc(s.n + 1, sizeof(Py_ssize_t));
+    if (s.candidates == NULL || s.clique == NULL || s.best_clique == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    s.best_weight = initial_weight;
+    s.best_size = -1;
+    s.deadline = time_limit >= 0 ? now() + time_limit : -1;
+    for (Py_ssize_t v = 0; v < s.n; v++)
+        s.candidates[v / 64] |= (uint64_t)1 << (v % 64);
+
+    Py_BEGIN_ALLOW_THREADS
+    expand(&s, 0, 0);
+    Py_END_ALLOW_THREADS
+
+    if (s.best_size >= 0) {
+        PyObject *clique = clique_list(s.best_clique, s.best_size);
+        if (clique != NULL)
+            result = Py_BuildValue("(LNLLO)", (long long)s.best_weight, clique, s.operations,
+                                   s.warm_start_prunes, s.timed_out ? Py_True : Py_False);
+    } else {
+        result = Py_BuildValue("(LOLLO)", (long long)s.best_weight, Py_None, s.operations,
+                               s.warm_start_prunes, s.timed_out ? Py_True : Py_False);
+    }
+
+done:
+    PyMem_Free(s.candidates);
+    PyMem_Free(s.clique);
+    PyMem_Free(s.best_clique);
+    PyBuffer_Release(&weights);
+    PyBuffer_Release(&adjacency);
+    return result;
+}
+
+/* greedy(weights, adjacency, time_limit)
+ *     -> (best_weight, clique positions or None, operations, timed_out) */
+static PyObject *greedy(PyObject *self, PyObject *args)
+{
+    Py_buffer weights, adjacency;
+    double time_limit;
+    if (!PyArg_ParseTuple(args, "y*y*d", &weights, &adjacency, &time_limit))
+        return NULL;
+
+    Search s;
+    memset(&s, 0, sizeof(s));
+    PyObject *result = NULL;
+    if (parse_graph(&s, &weights, &adjacency) < 0)
+        goto done;
+
+    s.candidates = PyMem_Calloc(s.words + 1, sizeof(uint64_t));
+    s.clique = PyMem_Calloc(s.n + 1, sizeof(Py_ssize_t));
+    s.best_clique = PyMem_Calloc(s.n + 1, sizeof(Py_ssize_t));
+    if (s.candidates == NULL || s.clique == NULL || s.best_clique == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    s.best_size = -1;
+    double deadline = time_limit >= 0 ? now() + time_limit : -1;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t start = 0; start < s.n; start++) {
+        if (deadline >= 0 && now() >= deadline) {
+            s.timed_out = 1;
+            break;
+        }
+
+        Py_ssize_t size = 1;
+        int64_t current_weight = s.weights[start];
+        s.clique[0] = start;
+        memcpy(s.candidates, s.adjacency + start * s.words, s.words * sizeof(uint64_t));
+
+        /* Expand with the heaviest common neighbor (lowest position) until there is none left */
+        while (!is_empty(s.candidates, s.words)) {
+            Py_ssize_t vertex = lowest(s.candidates, s.words);
+            s.operations += size;
+
+            s.clique[size++] = vertex;
+            current_weight += s.weights[vertex];
+            const uint64_t *neighbors = s.adjacency + vertex * s.words;
+            for (Py_ssize_t w = 0; w < s.words; w++)
+                s.candidates[w] &= neighbors[w];
+        }
+
+        if (current_weight > s.best_weight) {
+            s.best_weight = current_weight;
+            s.best_size = size;
+            memcpy(s.best_clique, s.clique, size * sizeof(Py_ssize_t));
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    if (s.best_size >= 0) {
+        PyObject *clique = clique_list(s.best_clique, s.best_size);
+        if (clique != NULL)
+            result = Py_BuildValue("(LNLO)", (long long)s.best_weight, clique, s.operations,
+                                   s.timed_out ? Py_True : Py_False);
+    } else {
+        result = Py_BuildValue("(LOLO)", (long long)s.best_weight, Py_None, s.operations,
+                               s.timed_out ? Py_True : Py_False);
+    }
+
+done:
+    PyMem_Free(s.candidates);
+    PyMem_Free(s.clique);
+    PyMem_Free(s.best_clique);
+    PyBuffer_Release(&weights);
+    PyBuffer_Release(&adjacency);
+    return result;
+}
+
+static PyMethodDef methods[] = {
+    {"backtrack", backtrack, METH_VARARGS, "Bitset branch and bound (BitsetBacktrackingSearch)."},
+    {"greedy", greedy, METH_VARARGS, "Multi-start bitset greedy (BitsetGreedySearch)."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT, "cliqueKernel", "Native kernel of the bitset clique searches.", -1, methods
+};
+
+PyMODINIT_FUNC PyInit_cliqueKernel(void)
+{
+    return PyModule_Create(&module);
+}
@@ -0,0 +1,86 @@
+import numpy as np
+from graph.generateGraph import generate_compact_graph
+
+# Access to the optional native kernel (algorithms/native/cliqueKernel.c).
+#
+# The kernel is built with `python setup.py build_ext --inplace`. The bitset solvers take a
+# `backend` argument:
+#
+# - "python": always use the Python implementation
+# - "native": use the kernel (ImportError if it was not built)
+# - "auto": use the kernel when it was built, the Python implementation otherwise
+#
+# check_parity() runs both backends on generated graphs and reports any difference in the
+# clique, its weight or the operation count (python -m algorithms.nativeKernel).
+
+try:
+    from algorithms.native import cliqueKernel
+except ImportError:
+    cliqueKernel = None
+
+BACKENDS = ("python", "native", "auto")
+
+
+def native_available() -> bool:
+    return cliqueKernel is not None
+
+
+def use_native(backend: str) -> bool:
+    """Whether a solver created with `backend` has to use the native kernel."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    if backend == "native" and cliqueKernel is None:
+        raise ImportError("The native kernel is not built, run: python setup.py build_ext --inplace")
+    return backend == "native" or (backend == "auto" and cliqueKernel is not None)
+
+
+def pack_graph(weights: list[int], adjacency: list[int]) -> tuple[bytes, bytes]:
+    """Weights and bitset rows (Python integers) in the layout the kernel expects."""
+    words = (len(weights) + 63) // 64
+    packed_weights = np.asarray(weights, dtype='<i8').tobytes()
+    packed_adjacency = b"".join(mask.to_bytes(words * 8, 'little') for mask in adjacency)
+    return packed_weights, packed_adjacency
+
+
+def time_limit_argument(seconds: float | None) -> float:
+    return -1.0 if seconds is None else max(seconds, 0.0)
+
+
+def check_parity(vertices=range(5, 81, 5), probabilities=(0.125, 0.25, 0.5, 0.75), seed=0) -> list[str]:
+    """Compare the Python and native backends of the bitset solvers on generated graphs.
+
+    Returns a description of every mismatch (an empty list when both backends agree).
+    """
+    from algorithms.bitsetBacktrackingSearch import BitsetBacktrackingSearch
+    from algorithms.bitsetGreedySearch import BitsetGreedySearch
+
+    if cliqueKernel is None:
+        raise ImportError("The native kernel is not built, run: python setup.py build_ext --inplace")
+
+    mismatches = []
+    for num_vertices in vertices:
+        for edges_prob in probabilities:
+            graph = generate_compact_graph(num_vertices, edges_prob, np.random.default_rng([seed, num_vertices, round(edges_prob * 1000)]))
+            greedy_clique = None
+            for algorithm_class in (BitsetGreedySearch, BitsetBacktrackingSearch):
+                results = []
+                for backend in ("python", "native"):
+                    if algorithm_class is BitsetBacktrackingSearch:
+                        algorithm = algorithm_class(graph, initial_clique=greedy_clique, backend=backend)
+                    else:
+                        algorithm = algorithm_class(graph, backend=backend)
+                    clique, operations, _ = algorithm.perform_search()
+                    results.append((clique.vertices if clique else None, clique.weight if clique else 0, operations,
+                                    getattr(algorithm, "warm_start_prunes", 0)))
+                    if algorithm_class is BitsetGreedySearch:
+                        greedy_clique = clique
+
+                if results[0] != results[1]:
+                    mismatches.append(f"{algorithm_class.__name__} {num_vertices} vertices, p={edges_prob}: "
+                                      f"python {results[0]} != native {results[1]}")
+    return mismatches
+
+
+if __name__ == "__main__":
+    mismatches = check_parity()
+    print("\n".join(mismatches) if mismatches else "Python and native backends agree")
@@ -0,0 +1,119 @@
+import time
+import numpy as np
+import networkx as nx
+from concurrent.futures import ProcessPoolExecutor
+from algorithms.bitsetGreedySearch import BitsetGreedySearch
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Multi-start greedy with dominance pruning and early termination.
+#
+# The greedy clique built from a starting vertex s can only contain s and neighbors of s, so
+# w(s) + w(N(s)) is an upper bound on its weight. Since the best clique is only replaced by a
+# strictly heavier one, a start whose bound is not above the best weight found so far can never
+# change the answer:
+#
+# 1. Compute the neighborhood bound of every vertex, and the maximum bound of all the starts
+#    from each position onwards (suffix maximum).
+#
+# 2. Run the starts in the same order as BitsetGreedySearch, skipping the starts whose bound is
+#    not above the best weight, and stopping altogether once the suffix maximum is not above it.
+#
+# 3. With workers > 1 the starts are dealt round-robin to a process pool. Each worker runs its
+#    starts in order with its own best weight, and the results are merged keeping the heaviest
+#    clique and, between equal weights, the one from the earliest start. The answer is the same
+#    clique BitsetGreedySearch returns; only Ops_Count goes down.
+#
+# The process pool cannot be used when the search itself already runs in a daemon process (as in
+# the parallel runner of run_simulation), so it is meant for solving single large graphs.
+
+
+class PrunedGreedySearch(BitsetGreedySearch):
+
+    INSTRUMENTED = False  # _search_starts has no counters (it also runs in other processes)
+
+    def __init__(self, graph: nx.Graph | CompactGraph, workers: int = 1):
+        super().__init__(graph, backend="python")
+        self.workers = workers
+
+        # Neighborhood bound of each vertex (its weight plus the weights of all its neighbors),
+        # listed in the same weight order as the positions of BitsetGreedySearch
+        compact = self.compact
+        sources = np.repeat(np.arange(compact.number_of_nodes()), np.diff(compact.indptr))
+        bounds = compact.weights + np.bincount(sources, weights=compact.weights[compact.indices],
+                                               minlength=compact.number_of_nodes()).astype(np.int64)
+        self.bounds = bounds[np.argsort(-compact.weights, kind='stable')].tolist()
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        time_limit = None if self.deadline is None else max(self.deadline - time.perf_counter(), 0)
+        workers = min(self.workers, len(self.weights))
+
+        if workers > 1:
+            starts = [list(range(worker, len(self.weights), workers)) for worker in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_search_starts, [self.weights] * workers, [self.adjacency] * workers,
+                                            [self.bounds] * workers, starts, [time_limit] * workers))
+        else:
+            results = [_search_starts(self.weights, self.adjacency, self.bounds, range(len(self.weights)), time_limit)]
+
+        # Heaviest clique, and the earliest start between equal weights
+        best = max(results, key=lambda result: (result[0], -result[1]))
+        max_clique_weight, _, current_clique, _, _ = best
+        performed_operations = sum(result[3] for result in results)
+        self.timed_out = any(result[4] for result in results)
+
+        max_clique = None
+        if current_clique is not None:
+            max_clique = Clique(vertices=[self.order[v] for v in current_clique], weight=max_clique_weight)
+        return max_clique, performed_operations, 1
+
+
+def _search_starts(weights, adjacency, bounds, starts, time_limit):
+    """Greedy cliques from `starts` (ascending positions), skipping the dominated ones.
+
+    Returns (best weight, its start, its clique positions, operations, timed out). Runs in the
+    workers of the process pool, so it only uses its arguments.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    starts = list(starts)
+
+    # Largest bound among the starts from each index onwards
+    remaining_bound = [0] * (len(starts) + 1)
+    for i in range(len(starts) - 1, -1, -1):
+        remaining_bound[i] = max(bounds[starts[i]], remaining_bound[i + 1])
+
+    performed_operations = 0
+    max_clique = None
+    max_clique_weight = 0
+    max_clique_start = len(weights)
+    timed_out = False
+
+    for i, starting_vertex in enumerate(starts):
+        # No remaining start can beat the best clique
+        if remaining_bound[i] <= max_clique_weight:
+            break
+        # This start cannot beat the best clique
+        if bounds[starting_vertex] <= max_clique_weight:
+            continue
+        if deadline is not None and time.perf_counter() >= deadline:
+            timed_out = True
+            break
+
+        current_clique = [starting_vertex]
+        current_weight = weights[starting_vertex]
+        candidates = adjacency[starting_vertex]
+
+        while candidates:
+            best_candidate = (candidates & -candidates).bit_length() - 1
+            performed_operations += len(current_clique)
+
+            current_clique.append(best_candidate)
+            current_weight += weights[best_candidate]
+            candidates &= adjacency[best_candidate]
+
+        if current_weight > max_clique_weight:
+            max_clique_weight = current_weight
+            max_clique = current_clique
+            max_clique_start = starting_vertex
+
+    return max_clique_weight, max_clique_start, max_clique, performed_operations, timed_out
@@ -0,0 +1,84 @@
+import inspect
+import time
+import networkx as nx
+from algorithms.bitsetBacktrackingSearch import BitsetBacktrackingSearch
+from algorithms.bitsetGreedySearch import BitsetGreedySearch
+from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
+from graph.reduction import reduce_graph
+from utils.domainClasses import Clique
+
+# Search on the reduced graph (see graph/reduction.py).
+#
+# 1. Find a lower bound with the bitset Greedy search (optional) and reduce the graph with it.
+#
+# 2. Solve every remaining connected component with `algorithm_class`, largest first. When the
+#    algorithm accepts an initial clique, the best clique so far is passed on, so the later
+#    (smaller) components are pruned against it.
+#
+# 3. The answer is the heaviest of the component cliques and the cliques found while reducing;
+#    the components keep the original labels, so it is already in the original vertex ids.
+#
+# Operations and tested solutions are the sums over the components. The number of removed
+# vertices, removed edges and components of the last search are kept in `reduction` and
+# reported as extra result columns.
+
+
+class ReducedSearch(SearchAlgorithm):
+
+    STATS = ("Removed_Vertices", "Removed_Edges", "Components")
+    INSTRUMENTED = True  # Counted by the greedy search and the component solvers
+
+    def __init__(self, graph: nx.Graph | CompactGraph, algorithm_class=BitsetBacktrackingSearch, greedy_lower_bound: bool = True):
+        super().__init__(graph)
+        self.algorithm_class = algorithm_class
+        self.greedy_lower_bound = greedy_lower_bound
+        self.warm_start = "initial_clique" in inspect.signature(algorithm_class).parameters
+        self.reduction = None
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        performed_operations = 0
+        tested_solutions = 0
+
+        initial_clique = None
+        if self.greedy_lower_bound:
+            greedy = BitsetGreedySearch(self.compact)
+            if self.instrumentation is not None:
+                greedy.instrument(self.instrumentation)
+            initial_clique, operations, tested = greedy.perform_search()
+            performed_operations += operations
+            tested_solutions += tested
+
+        self.reduction = reduce_graph(self.compact, initial_clique)
+        max_clique = self.reduction.best_clique
+
+        for component in self.reduction.components:
+            if self.deadline_reached():
+                break
+
+            if self.warm_start:
+                algorithm = self.algorithm_class(component, initial_clique=max_clique)
+            else:
+                algorithm = self.algorithm_class(component)
+            algorithm.set_time_limit(self.deadline - time.perf_counter() if self.deadline is not None else None)
+            if self.instrumentation is not None:
+                algorithm.instrument(self.instrumentation)
+
+            clique, operations, tested = algorithm.perform_search()
+            performed_operations += operations
+            tested_solutions += tested
+            if clique is not None and (max_clique is None or clique.weight > max_clique.weight):
+                max_clique = clique
+
+            if algorithm.timed_out:
+                self.timed_out = True
+                break
+
+        return max_clique, performed_operations, tested_solutions
+
+    def search_stats(self) -> dict:
+        return {
+            "Removed_Vertices": self.reduction.removed_vertices,
+            "Removed_Edges": self.reduction.removed_edges,
+            "Components": len(self.reduction.components),
+        }
@@ -1,18 +1,61 @@
+import time
 from typing import Tuple
+from graph.compactGraph import CompactGraph
 from graph.drawGraph import draw_graph
 from utils.domainClasses import Clique
+from utils.instrumentation import Instrumentation
 import networkx as nx
 
 class SearchAlgorithm:
 
-    def __init__(self, graph: nx.Graph):
+    # Names of the extra result columns reported by search_stats()
+    STATS = ()
+
+    # Whether the search reports its counters to an Instrumentation (see instrument())
+    INSTRUMENTED = False
+
+    # Largest number of vertices the search supports (None for no limit); run_simulation skips
+    # the larger instances
+    MAX_VERTICES = None
+
+    def __init__(self, graph: nx.Graph | CompactGraph):
         self.graph = graph
+        self.compact = CompactGraph.of(graph)  # Array-backed form used by the searches
+        self.deadline = None  # time.perf_counter() value after which the search must stop
+        self.timed_out = False
+        self.instrumentation = None  # Instrumentation of the next search (None disables it)
+
+    def instrument(self, instrumentation: Instrumentation | None = None) -> Instrumentation:
+        """Count the operations of the next search in `instrumentation` (a new one by default).
+
+        See utils/instrumentation.py. Searches that share an Instrumentation add up their counters.
+        """
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        return self.instrumentation
+
+    def set_time_limit(self, seconds: float | None):
+        """Limit the next search to `seconds` (None removes the limit).
+
+        Searches check the deadline cooperatively and, when it passes, return the best clique
+        found so far with `timed_out` set to True.
+        """
+        self.deadline = time.perf_counter() + seconds if seconds is not None else None
+        self.timed_out = False
+
+    def deadline_reached(self) -> bool:
+        if self.deadline is not None and not self.timed_out and time.perf_counter() >= self.deadline:
+            self.timed_out = True
+        return self.timed_out
 
     def perform_search(self) -> Clique:
         raise NotImplemented()
 
+    def search_stats(self) -> dict:
+        """Values of the STATS columns for the last search."""
+        return {}
+
     def draw_graph(self):
-        draw_graph(self.graph)
+        draw_graph(self.graph if isinstance(self.graph, nx.Graph) else self.graph.to_networkx())
 
     @staticmethod
     def print_results(clique: Clique, header: str):
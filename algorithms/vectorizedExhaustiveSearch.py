@@ -0,0 +1,135 @@
+import networkx as nx
+import numpy as np
+from algorithms.searchAlgorithm import SearchAlgorithm
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Bit-parallel variant of the Exhaustive algorithm.
+#
+# Every subset of vertices is an integer mask (bit i set <=> the i-th vertex is in the subset),
+# so all 2^n subsets are simply the integers 0 .. 2^n - 1. They are enumerated in blocks of
+# 2^k consecutive masks: inside a block the high bits (vertices k .. n-1) are fixed and the
+# low bits (vertices 0 .. k-1) take every possible value.
+#
+# 1. For every vertex i we precompute the mask of the vertices NOT adjacent to it (i itself
+#    excluded). A subset is a clique when, for every vertex i it contains, the subset has no
+#    bit in common with that mask.
+#
+# 2. The 2^k low subsets are tested once with NumPy: which of them are cliques and their
+#    weights (dot product of the membership bits with the vertex weights).
+#
+# 3. For each block, the fixed high part H must be a clique, and a low subset L extends it
+#    into a clique only when L is a clique with no bit in common with the non-neighbors of H.
+#    That is a single vectorized AND over the whole block, and the weights of the block are
+#    the low weights plus the weight of H.
+#
+# 4. Only the heaviest clique found so far is kept, instead of a list with every clique.
+#
+# Operations are counted as one adjacency mask test per vertex of each subset plus one weight
+# sum per clique found, mirroring the pair checks and weight sums of ExhaustiveSearch.
+
+
+class VectorizedExhaustiveSearch(SearchAlgorithm):
+
+    # Subsets are stored as unsigned 64 bit integers
+    MAX_VERTICES = 63
+
+    def __init__(self, graph: nx.Graph | CompactGraph, block_size: int = 1 << 20):
+        super().__init__(graph)
+        self.block_size = block_size
+        self.vertices = self.compact.nodes
+
+        if len(self.vertices) > self.MAX_VERTICES:
+            raise ValueError(f"VectorizedExhaustiveSearch supports at most {self.MAX_VERTICES} vertices")
+
+        self.weights = self.compact.weights
+        self.non_adjacency = self._build_non_adjacency_masks()
+
+    def _build_non_adjacency_masks(self) -> np.ndarray:
+        """Mask of the vertices that are not adjacent to each vertex (the vertex itself excluded)."""
+        all_vertices = (1 << len(self.vertices)) - 1
+        masks = [all_vertices & ~(neighbors | 1 << i) for i, neighbors in enumerate(self.compact.adjacency_masks)]
+        return np.array(masks, dtype=np.uint64)
+
+    def perform_search(self) -> tuple[Clique | None, int, int]:
+        num_vertices = len(self.vertices)
+        total_subsets = 1 << num_vertices
+        low_bits = min(num_vertices, max(self.block_size.bit_length() - 1, 0))
+        low_masks, low_is_clique, low_weights = self._low_subsets(low_bits)
+
+        max_clique_mask = None
+        max_clique_weight = 0
+        cliques_found = 0
+        tested_solutions = 0
+
+        for high in range(total_subsets >> low_bits):
+            # Stop when the time limit is over, keeping the best clique found so far
+            if self.deadline_reached():
+                break
+            tested_solutions += 1 << low_bits
+
+            high_weight, high_conflicts = self._high_subset(high, low_bits)
+
+            # The fixed high part is not a clique, so neither is any subset of this block
+            if high_conflicts is None:
+                continue
+
+            # Low subsets that are cliques and are adjacent to every vertex of the high part
+            is_clique = low_is_clique & ((low_masks & np.uint64(high_conflicts)) == 0)
+
+            # The empty subset is not a clique for the final result
+            if high == 0:
+                is_clique[0] = False
+
+            count = int(np.count_nonzero(is_clique))
+            if count == 0:
+                continue
+            cliques_found += count
+
+            clique_weights = np.where(is_clique, low_weights, -1)
+            best = int(np.argmax(clique_weights))
+            if clique_weights[best] + high_weight > max_clique_weight:
+                max_clique_weight = int(clique_weights[best]) + high_weight
+                max_clique_mask = (high << low_bits) | best
+
+        max_clique = None
+        if max_clique_mask is not None:
+            vertices = [vertex for i, vertex in enumerate(self.vertices) if max_clique_mask >> i & 1]
+            max_clique = Clique(vertices=vertices, weight=max_clique_weight)
+
+        # Each vertex belongs to half of the tested subsets, so the mask tests add up to n * 2^(n-1)
+        performed_operations = num_vertices * (tested_solutions >> 1) + cliques_found
+        return max_clique, performed_operations, tested_solutions
+
+    def _low_subsets(self, low_bits: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Masks, clique flags and weights of every subset of the first `low_bits` vertices."""
+        low_masks = np.arange(1 << low_bits, dtype=np.uint64)
+        shifts = np.arange(low_bits, dtype=np.uint64)
+
+        # members[s, i] is True when the i-th vertex belongs to the subset s
+        members = ((low_masks[:, None] >> shifts) & np.uint64(1)).astype(bool)
+
+        # A subset is a clique if none of its members has a non-neighbor inside the subset
+        conflicts = (low_masks[:, None] & self.non_adjacency[None, :low_bits]) != 0
+        is_clique = ~np.any(members & conflicts, axis=1)
+
+        weights = members @ self.weights[:low_bits]
+        return low_masks, is_clique, weights
+
+    def _high_subset(self, high: int, low_bits: int) -> tuple[int, int | None]:
+        """Weight of the high part of a block and the union of the non-neighbors of its vertices.
+
+        The union is None when the high part is not a clique.
+        """
+        weight = 0
+        conflicts = 0
+        subset = high << low_bits
+        while high:
+            low_bit = high & -high
+            vertex = low_bit.bit_length() - 1 + low_bits
+            if subset & int(self.non_adjacency[vertex]):
+                return weight, None
+            weight += int(self.weights[vertex])
+            conflicts |= int(self.non_adjacency[vertex])
+            high ^= low_bit
+        return weight, conflicts
@@ -0,0 +1,164 @@
+import numpy as np
+import networkx as nx
+
+# Array-backed, read-only graph used by the search algorithms.
+#
+# Vertices are the integers 0 .. n-1 (the original networkx labels are kept in `nodes`):
+#
+# - weights: int64 array with the weight of each vertex
+# - positions: optional (n, 2) array with the (x, y) of each vertex, only used for drawing
+# - CSR adjacency: the neighbors of vertex i are indices[indptr[i]:indptr[i + 1]] (in the order
+#   networkx reports them when built from an nx.Graph, sorted when built from edge arrays, so
+#   that the searches visit neighbors in the same order on both representations)
+# - adjacency_masks: optional bitset rows (bit j of row i is set when i and j are neighbors),
+#   built on first use
+# - weight_order / weight_order_masks: the vertices sorted by weight (heaviest first) and the
+#   bitset rows in that order, also built on first use, so that several searches run on the
+#   same CompactGraph share them
+#
+# Compared with nx.Graph (a dict of dicts per vertex plus an attribute dict per vertex), this
+# uses a few contiguous arrays, and reading a weight or testing an edge does not go through
+# nested dictionary lookups.
+
+
+class CompactGraph:
+
+    def __init__(self, weights, indptr, indices, nodes=None, positions=None):
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.nodes = list(range(len(self.weights))) if nodes is None else list(nodes)
+        self.positions = None if positions is None else np.asarray(positions)
+        self._adjacency_masks = None
+        self._weight_list = None
+        self._weight_order = None
+        self._weight_order_masks = None
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph) -> "CompactGraph":
+        nodes = list(graph.nodes)
+        position = {node: i for i, node in enumerate(nodes)}
+        weights = [graph.nodes[node]['weight'] for node in nodes]
+
+        positions = None
+        if all('pos' in graph.nodes[node] for node in nodes):
+            positions = [graph.nodes[node]['pos'] for node in nodes]
+
+        indptr = [0]
+        indices = []
+        for node in nodes:
+            indices.extend(position[neighbor] for neighbor in graph.adj[node] if neighbor != node)
+            indptr.append(len(indices))
+        return cls(weights, indptr, indices, nodes=nodes, positions=positions)
+
+    @classmethod
+    def from_edges(cls, num_vertices, edges_u, edges_v, weights, nodes=None, positions=None) -> "CompactGraph":
+        """Build the graph from the two endpoint arrays of its (undirected) edges."""
+        edges_u = np.asarray(edges_u, dtype=np.int64)
+        edges_v = np.asarray(edges_v, dtype=np.int64)
+
+        # Every edge appears in the rows of both endpoints
+        sources = np.concatenate([edges_u, edges_v])
+        targets = np.concatenate([edges_v, edges_u])
+        order = np.lexsort((targets, sources))
+
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_vertices), out=indptr[1:])
+        return cls(weights, indptr, targets[order], nodes=nodes, positions=positions)
+
+    @staticmethod
+    def of(graph) -> "CompactGraph":
+        """The graph itself if it is already a CompactGraph, otherwise its compact form."""
+        return graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+
+    def number_of_nodes(self) -> int:
+        return len(self.weights)
+
+    def number_of_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def degree(self, vertex: int) -> int:
+        return int(self.indptr[vertex + 1] - self.indptr[vertex])
+
+    def neighbors(self, vertex: int) -> np.ndarray:
+        return self.indices[self.indptr[vertex]:self.indptr[vertex + 1]]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return bool(self.adjacency_masks[u] >> v & 1)
+
+    @property
+    def weight_list(self) -> list[int]:
+        """Weights as a Python list, which is faster than the NumPy array for scalar access."""
+        if self._weight_list is None:
+            self._weight_list = self.weights.tolist()
+        return self._weight_list
+
+    @property
+    def adjacency_masks(self) -> list[int]:
+        """Bitset row of each vertex, as Python integers."""
+        if self._adjacency_masks is None:
+            self._adjacency_masks = self.adjacency_masks_in_order(range(self.number_of_nodes()))
+        return self._adjacency_masks
+
+    @property
+    def weight_order(self) -> list[int]:
+        """Vertices sorted by weight, heaviest first (ties keep the lowest index first)."""
+        if self._weight_order is None:
+            weights = self.weight_list
+            self._weight_order = sorted(range(self.number_of_nodes()), key=lambda v: weights[v], reverse=True)
+        return self._weight_order
+
+    @property
+    def weight_order_masks(self) -> list[int]:
+        """Bitset rows in weight order (see adjacency_masks_in_order(weight_order))."""
+        if self._weight_order_masks is None:
+            self._weight_order_masks = self.adjacency_masks_in_order(self.weight_order)
+        return self._weight_order_masks
+
+    def adjacency_masks_in_order(self, order) -> list[int]:
+        """Bitset rows where bit i stands for the vertex order[i] (rows are also in that order).
+
+        `order` must be a permutation of all the vertices.
+        """
+        order = list(order)
+        rank = np.empty(self.number_of_nodes(), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+
+        masks = []
+        row = np.zeros(len(order), dtype=bool)
+        for vertex in order:
+            neighbor_ranks = rank[self.neighbors(vertex)]
+            row[neighbor_ranks] = True
+            masks.append(int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little'))
+            row[neighbor_ranks] = False
+        return masks
+
+    def subgraph(self, vertices) -> "CompactGraph":
+        """Subgraph induced by `vertices` (indices), which keeps their original labels in `nodes`."""
+        vertices = np.asarray(vertices, dtype=np.int64)
+        new_index = np.full(self.number_of_nodes(), -1, dtype=np.int64)
+        new_index[vertices] = np.arange(len(vertices))
+
+        # Edges (u < v) with both endpoints in the subgraph, renumbered
+        sources = np.repeat(np.arange(self.number_of_nodes()), np.diff(self.indptr))
+        kept = (sources < self.indices) & (new_index[sources] >= 0) & (new_index[self.indices] >= 0)
+        positions = self.positions[vertices] if self.positions is not None else None
+        return CompactGraph.from_edges(len(vertices), new_index[sources[kept]], new_index[self.indices[kept]],
+                                       self.weights[vertices], nodes=[self.nodes[v] for v in vertices.tolist()],
+                                       positions=positions)
+
+    def to_networkx(self) -> nx.Graph:
+        G = nx.Graph()
+        for i, node in enumerate(self.nodes):
+            if self.positions is not None:
+                G.add_node(node, pos=tuple(self.positions[i].tolist()), weight=int(self.weights[i]))
+            else:
+                G.add_node(node, weight=int(self.weights[i]))
+
+        sources = np.repeat(np.arange(self.number_of_nodes()), np.diff(self.indptr))
+        upper = sources < self.indices
+        G.add_edges_from((self.nodes[u], self.nodes[v]) for u, v in zip(sources[upper].tolist(), self.indices[upper].tolist()))
+        return G
+
+    def __repr__(self):
+        return "CompactGraph [Vertices: {0}, Edges: {1}]".format(self.number_of_nodes(), self.number_of_edges())
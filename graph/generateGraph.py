@@ -1,10 +1,24 @@
 import numpy as np
 import networkx as nx
 from math import comb, floor
+from graph.compactGraph import CompactGraph
 
-def generate_graph(v, p):
-    n_mec = 108215
-    np.random.seed(n_mec)
+N_MEC = 108215
+
+def instance_seed_sequence(seed, v, p, replicate=0) -> np.random.SeedSequence:
+    """SeedSequence independente para a instância (v, p, replicate).
+
+    É o filho que SeedSequence(seed).spawn(...) daria no caminho (v, p, replicate) da árvore de
+    spawn, criado diretamente através do spawn_key para não ter de gerar os irmãos anteriores.
+    """
+    return np.random.SeedSequence(seed, spawn_key=(v, round(p * 1000), replicate))
+
+
+def generate_graph(v, p, rng: np.random.Generator | int | None = None):
+    # Usar um gerador local (por omissão, com a seed própria da instância) em vez de voltar a
+    # semear o estado global do NumPy em cada chamada
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(instance_seed_sequence(N_MEC, v, p) if rng is None else rng)
     num_edges = floor(comb(v, 2) * p)
 
     # Criar um grafo não direcionado
@@ -13,16 +27,16 @@ def generate_graph(v, p):
     # Adicionar nós com pesos aleatórios
     for i in range(v):
         #alterar para 1000 TODO
-        x = np.random.randint(1, 1001)
-        y = np.random.randint(1, 1001)
-        weight = np.random.randint(1, 50)
+        x = int(rng.integers(1, 1001))
+        y = int(rng.integers(1, 1001))
+        weight = int(rng.integers(1, 50))
         G.add_node(i, pos=(x, y), weight=weight)
 
     # Adicionar arestas aleatórias até alcançar o número necessário
     edges = set()  # Usar um set para evitar duplicação
     while len(edges) < num_edges:
-        v1 = np.random.randint(0, v)
-        v2 = np.random.randint(0, v)
+        v1 = int(rng.integers(0, v))
+        v2 = int(rng.integers(0, v))
 
         # Garantir que não estamos a criar um loop (aresta para o próprio nó)
         if v1 != v2 and (v1, v2) not in edges and (v2, v1) not in edges:
@@ -31,6 +45,32 @@ def generate_graph(v, p):
 
     return G
 
+def generate_compact_graph(v, p, rng: np.random.Generator | int | None = None) -> CompactGraph:
+    """Gera um grafo aleatório com `floor(comb(v, 2) * p)` arestas distintas, na forma compacta.
+
+    As arestas são sorteadas de uma só vez, sem repetição, entre os índices do triângulo superior
+    da matriz de adjacência, pelo que não há rejeições nem arestas adicionadas uma a uma. O grafo
+    networkx só é construído se for pedido (`to_networkx()`).
+
+    O `rng` pode ser um np.random.Generator ou uma seed (inteiro ou SeedSequence); por omissão
+    usa-se a seed da instância derivada de N_MEC.
+    """
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(instance_seed_sequence(N_MEC, v, p) if rng is None else rng)
+
+    num_edges = floor(comb(v, 2) * p)
+
+    # Posições e pesos aleatórios dos vértices
+    positions = rng.integers(1, 1001, size=(v, 2))
+    weights = rng.integers(1, 50, size=v)
+
+    # Sortear arestas distintas entre os pares (i, j) com i < j
+    rows, cols = np.triu_indices(v, k=1)
+    selected = np.sort(rng.choice(len(rows), size=num_edges, replace=False))
+
+    return CompactGraph.from_edges(v, rows[selected], cols[selected], weights, positions=positions)
+
+
 def clique_weight(G, clique):
     """Calcula o peso total de um clique."""
     return sum(G.nodes[node]['weight'] for node in clique)
@@ -0,0 +1,167 @@
+import json
+import os
+import numpy as np
+from graph.compactGraph import CompactGraph
+from concurrent.futures import ProcessPoolExecutor
+from graph.generateGraph import N_MEC, generate_compact_graph, instance_seed_sequence
+
+# On-disk store of the generated graphs.
+#
+# Each (vertices, edges_prob, seed, replicate) instance is kept in its own binary record, a single int32
+# .npy file with the CompactGraph arrays laid out one after the other:
+#
+#     [num_vertices, num_indices, weights (n), positions (2n), indptr (n + 1), indices]
+#
+# Records are loaded with np.load(mmap_mode='r'), so only the pages that are actually read are
+# brought into memory, and the CSR indices are used directly from the mapping. The index file
+# (index.jsonl) has one JSON line per record and is only appended to. A graph that is not in
+# the store is generated on demand and saved, so a run only touches the instances it uses;
+# `generate` fills the store for many instances at once using a process pool.
+#
+# Every instance is generated from its own np.random.Generator, seeded with the SeedSequence
+# spawned for (vertices, edges_prob, replicate), so instances are statistically independent
+# and several replicates of the same configuration can be kept.
+
+DEFAULT_STORE_DIR = "graph/data/store"
+INDEX_FILENAME = "index.jsonl"
+
+
+class GraphStore:
+
+    def __init__(self, directory: str = DEFAULT_STORE_DIR, seed: int = N_MEC):
+        self.directory = directory
+        self.seed = seed
+        self.index = self._read_index()
+
+    @staticmethod
+    def key(vertices: int, edges_prob: float, seed: int, replicate: int = 0) -> str:
+        return f"v{vertices}_p{round(edges_prob * 1000)}_s{seed}_r{replicate}"
+
+    def _read_index(self) -> dict:
+        index = {}
+        index_path = os.path.join(self.directory, INDEX_FILENAME)
+        if not os.path.exists(index_path):
+            return index
+
+        with open(index_path, "rb+") as index_file:
+            content = index_file.read()
+            # Descartar uma última linha incompleta (escrita interrompida)
+            if content and not content.endswith(b"\n"):
+                content = content[:content.rfind(b"\n") + 1]
+                index_file.truncate(len(content))
+
+        for line in content.decode().splitlines():
+            entry = json.loads(line)
+            index[entry["key"]] = entry
+        return index
+
+    def __contains__(self, config) -> bool:
+        vertices, edges_prob, replicate = config
+        entry = self.index.get(self.key(vertices, edges_prob, self.seed, replicate))
+        return entry is not None and os.path.exists(os.path.join(self.directory, entry["file"]))
+
+    def get(self, vertices: int, edges_prob: float, replicate: int = 0) -> CompactGraph:
+        """Graph of the given instance, generated and saved first if it is not in the store yet."""
+        key = self.key(vertices, edges_prob, self.seed, replicate)
+        if (vertices, edges_prob, replicate) in self:
+            return self._load(self.index[key]["file"])
+
+        self._register(_generate_record(self.directory, self.seed, vertices, edges_prob, replicate))
+        return self._load(self.index[key]["file"])
+
+    def generate(self, configs, workers: int = 1):
+        """Generate (in parallel, with `workers` processes) the instances missing from the store.
+
+        `configs` are (vertices, edges_prob, replicate) tuples. Every instance has its own
+        random stream, so the graphs do not depend on the order or process they are made in.
+        """
+        missing = [config for config in configs if config not in self]
+        if not missing:
+            return
+
+        tasks = [(self.directory, self.seed, *config) for config in missing]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for entry in executor.map(_generate_record, *zip(*tasks), chunksize=16):
+                    self._register(entry)
+        else:
+            for task in tasks:
+                self._register(_generate_record(*task))
+
+    def _register(self, entry: dict):
+        # Só o processo principal escreve no índice
+        with open(os.path.join(self.directory, INDEX_FILENAME), "a") as index_file:
+            index_file.write(json.dumps(entry) + "\n")
+        self.index[entry["key"]] = entry
+
+    def _load(self, filename: str) -> CompactGraph:
+        return read_record(os.path.join(self.directory, filename))
+
+
+def _generate_record(directory: str, seed: int, vertices: int, edges_prob: float, replicate: int) -> dict:
+    """Generate one instance, write its record and return its index entry (runs in the workers)."""
+    key = GraphStore.key(vertices, edges_prob, seed, replicate)
+    rng = np.random.default_rng(instance_seed_sequence(seed, vertices, edges_prob, replicate))
+    graph = generate_compact_graph(vertices, edges_prob, rng)
+
+    os.makedirs(directory, exist_ok=True)
+    filename = f"{key}.npy"
+    write_record(os.path.join(directory, filename), graph)
+    return {"key": key, "file": filename, "vertices": vertices, "edges_prob": edges_prob,
+            "seed": seed, "replicate": replicate, "edges": graph.number_of_edges()}
+
+
+def write_record(path: str, graph: CompactGraph):
+    num_vertices = graph.number_of_nodes()
+    record = np.concatenate([
+        [num_vertices, len(graph.indices)],
+        graph.weights,
+        graph.positions.ravel() if graph.positions is not None else np.zeros(2 * num_vertices),
+        graph.indptr,
+        graph.indices,
+    ]).astype(np.int32)
+
+    # Escrever num ficheiro temporário e renomear, para nunca deixar registos incompletos
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as record_file:
+        np.save(record_file, record)
+    os.replace(temporary_path, path)
+
+
+def read_record(path: str) -> CompactGraph:
+    record = np.load(path, mmap_mode='r')
+    num_vertices, num_indices = int(record[0]), int(record[1])
+
+    offset = 2
+    weights = record[offset:offset + num_vertices]
+    offset += num_vertices
+    positions = record[offset:offset + 2 * num_vertices].reshape(num_vertices, 2)
+    offset += 2 * num_vertices
+    indptr = record[offset:offset + num_vertices + 1]
+    offset += num_vertices + 1
+    indices = record[offset:offset + num_indices]
+
+    return CompactGraph(weights, indptr, indices, positions=positions)
+
+
+class GraphSet:
+    """Lazy sequence of (graph, edges_prob, replicate) instances backed by a GraphStore.
+
+    Only the (vertices, edges_prob, replicate) configurations are kept in memory; each graph is
+    read from (or generated into) the store when the iteration reaches it.
+    """
+
+    def __init__(self, store: GraphStore, configs: list[tuple[int, float, int]]):
+        self.store = store
+        self.configs = list(configs)
+
+    def __len__(self):
+        return len(self.configs)
+
+    def __iter__(self):
+        for vertices, edges_prob, replicate in self.configs:
+            yield self.store.get(vertices, edges_prob, replicate), edges_prob, replicate
+
+    def select(self, predicate) -> "GraphSet":
+        """The instances whose (vertices, edges_prob, replicate) satisfy `predicate`, without loading any graph."""
+        return GraphSet(self.store, [config for config in self.configs if predicate(*config)])
@@ -0,0 +1,108 @@
+import numpy as np
+from graph.compactGraph import CompactGraph
+from utils.domainClasses import Clique
+
+# Reduction of a graph before the maximum weight clique search.
+#
+# Vertices are removed while one of these rules applies (until none does):
+#
+# - Isolated vertex: the only clique containing it is the vertex itself, which is kept as a
+#   candidate solution.
+# - Vertex of degree 1: the heaviest clique containing it is the edge to its only neighbor,
+#   which is kept as a candidate solution.
+# - Dominated vertex: its weight plus the weight of its (remaining) neighbors is not above the
+#   lower bound (the heaviest known clique), so no clique through it can beat the bound.
+#
+# Removing a vertex lowers the degree and the neighborhood weight of its neighbors, so they are
+# checked again; when a candidate raises the lower bound, every remaining vertex is checked again.
+# What is left is split into connected components, which can be solved separately, because a
+# clique never spans two components. The component graphs keep the original vertex labels in
+# `nodes`, so their cliques are already expressed in the original vertex ids.
+
+
+class Reduction:
+
+    def __init__(self, components: list[CompactGraph], best_clique: Clique | None, removed_vertices: int, removed_edges: int):
+        self.components = components  # Remaining connected components, largest first
+        self.best_clique = best_clique  # Heaviest clique known (given lower bound or found while reducing)
+        self.removed_vertices = removed_vertices
+        self.removed_edges = removed_edges
+
+    def __repr__(self):
+        return "Reduction [Components: {0}, Removed Vertices: {1}, Removed Edges: {2}]".format(
+            len(self.components), self.removed_vertices, self.removed_edges)
+
+
+def reduce_graph(graph: CompactGraph, initial_clique: Clique | None = None) -> Reduction:
+    """Reduce `graph` and split it into components (see the rules above).
+
+    `initial_clique` is a known clique of the graph (for example the Greedy result); its weight
+    is the starting lower bound of the dominance rule.
+    """
+    num_vertices = graph.number_of_nodes()
+    weights = graph.weight_list
+    neighbors = [graph.neighbors(v).tolist() for v in range(num_vertices)]
+
+    alive = [True] * num_vertices
+    degree = [len(adjacent) for adjacent in neighbors]
+    sources = np.repeat(np.arange(num_vertices), np.diff(graph.indptr))
+    neighborhood_weight = np.bincount(sources, weights=graph.weights[graph.indices], minlength=num_vertices).astype(np.int64).tolist()
+
+    best_clique = initial_clique
+    lower_bound = initial_clique.weight if initial_clique is not None else 0
+
+    pending = list(range(num_vertices))
+    while pending:
+        vertex = pending.pop()
+        if not alive[vertex]:
+            continue
+
+        candidate = None
+        if degree[vertex] == 0:
+            candidate = [vertex]
+        elif degree[vertex] == 1:
+            candidate = [vertex, next(u for u in neighbors[vertex] if alive[u])]
+        elif weights[vertex] + neighborhood_weight[vertex] > lower_bound:
+            continue
+
+        # Remove the vertex and check its neighbors again
+        alive[vertex] = False
+        for u in neighbors[vertex]:
+            if alive[u]:
+                degree[u] -= 1
+                neighborhood_weight[u] -= weights[vertex]
+                pending.append(u)
+
+        if candidate is not None and sum(weights[v] for v in candidate) > lower_bound:
+            lower_bound = sum(weights[v] for v in candidate)
+            best_clique = Clique(vertices=[graph.nodes[v] for v in candidate], weight=lower_bound)
+            pending.extend(v for v in range(num_vertices) if alive[v])
+
+    components = [graph.subgraph(component) for component in _connected_components(neighbors, alive)]
+    components.sort(key=CompactGraph.number_of_nodes, reverse=True)
+
+    removed_vertices = num_vertices - sum(component.number_of_nodes() for component in components)
+    removed_edges = graph.number_of_edges() - sum(component.number_of_edges() for component in components)
+    return Reduction(components, best_clique, removed_vertices, removed_edges)
+
+
+def _connected_components(neighbors: list[list[int]], alive: list[bool]) -> list[list[int]]:
+    """Connected components (sorted vertex lists) of the vertices still alive."""
+    seen = [not is_alive for is_alive in alive]
+    components = []
+    for start in range(len(neighbors)):
+        if seen[start]:
+            continue
+
+        seen[start] = True
+        component = [start]
+        stack = [start]
+        while stack:
+            vertex = stack.pop()
+            for u in neighbors[vertex]:
+                if not seen[u]:
+                    seen[u] = True
+                    component.append(u)
+                    stack.append(u)
+        components.append(sorted(component))
+    return components
@@ -1,42 +1,119 @@
-import pickle
-import time
+import argparse
 import os
-import csv
+import sys
+from contextlib import ExitStack
 import pandas as pd
 from algorithms.backtrackingSearch import BacktrackingSearch
+from algorithms.bitsetBacktrackingSearch import BitsetBacktrackingSearch
+from algorithms.coloringBacktrackingSearch import ColoringBacktrackingSearch
 from algorithms.exhaustiveSearch import ExhaustiveSearch
+from algorithms.vectorizedExhaustiveSearch import VectorizedExhaustiveSearch
 from algorithms.greedySearch import GreedySearch
-from graph.generateGraph import generate_graph
+from algorithms.bitsetGreedySearch import BitsetGreedySearch
+from algorithms.prunedGreedySearch import PrunedGreedySearch
+from algorithms.localSearch import LocalSearch
+from algorithms.reducedSearch import ReducedSearch
+from algorithms.iterativeBacktrackingSearch import IterativeBacktrackingSearch
+from algorithms.cliqueEnumeration import CliqueEnumeration
+from algorithms.fusedSearch import FusedExhaustiveSearch, FusedSearch
+from graph.graphStore import GraphSet, GraphStore
 from graph.saveGraphExample import save_graph_example
 from utils.plots import plot_vertices_vs_search_time_greedy, plot_edge_prob_vs_search_time, plot_vertices_vs_tested_solutions, plot_vertices_vs_operations_count_greedy, plot_edge_prob_vs_max_clique_weight, plot_vertices_vs_max_clique_weight, plot_vertices_vs_search_time_exhaustive, plot_vertices_vs_operations_count_exhaustive, plot_vertices_vs_operations_count_075, plot_vertices_vs_search_time_075
-from utils.utils import compare_greedy_backtracking_accuracy
+from utils.instrumentation import Instrumentation
+from utils.profiling import Profiler
+from utils.checkpoint import instance_configs, instances_up_to, load_checkpoint, pending_instances, select_instances
+from utils.parallelRunner import run_parallel, run_sequential
+from utils.benchmark import Benchmark, STATS as BENCHMARK_STATS
+from utils.scheduler import CostModel, Scheduler
+from utils.resultsSink import ProgressPrinter, ResultsSink, export_columnar, render_txt
+from utils.utils import compare_greedy_backtracking_accuracy, fused_accuracy_comparison
 
+# Algorithms available in the menu, by name (the name is also used for the results files)
+ALGORITHMS = {
+    "Exhaustive": ExhaustiveSearch,
+    "Greedy": GreedySearch,
+    "Backtracking": BacktrackingSearch,
+    "BitsetBacktracking": BitsetBacktrackingSearch,
+    "ColoringBacktracking": ColoringBacktrackingSearch,
+    "VectorizedExhaustive": VectorizedExhaustiveSearch,
+    "BitsetGreedy": BitsetGreedySearch,
+    "PrunedGreedy": PrunedGreedySearch,
+    "LocalSearch": LocalSearch,
+    "ReducedBacktracking": ReducedSearch,
+    "IterativeBacktracking": IterativeBacktrackingSearch,
+    "CliqueEnumeration": CliqueEnumeration,
+    "Fused": FusedSearch,  # Greedy + Backtracking (warm start) with the accuracy comparison
+    "FusedExhaustive": FusedExhaustiveSearch,  # The same, plus Exhaustive on the small instances
+}
 
-def main(output_mode=False):
+# Algorithms that accept an initial clique (warm start from the Greedy result)
+WARM_START_ALGORITHMS = ("Backtracking", "BitsetBacktracking", "ColoringBacktracking", "IterativeBacktracking")
+
+# Edge probabilities of the generated graphs
+EDGE_PROBABILITIES = [0.125, 0.25, 0.5, 0.75]
+
+# Number of independent graphs generated for each (vertices, edges_prob) configuration
+REPLICATES = 1
+
+# Time limit (seconds) of each instance; the sequential sweep stops at the first one that hits it
+SEARCH_TIMEOUT = 120
+
+
+def main(output_mode=False, workers=1, warm_start=False, benchmark=None, schedule=False):
     
     #ask user for the algorithm to be used
-    algorithm_name = input("Enter the algorithm number to be used: \n1. Exhaustive\n2. Greedy\n3. Backtracking\n")
-    while algorithm_name not in ["1", "2", "3"]:
-        algorithm_name = input("Invalid input. Please enter a valid algorithm number: \n1. Exhaustive\n2. Greedy\n3. Backtracking\n")
-    if algorithm_name == "1":
-        algorithm_name = "Exhaustive"
-    elif algorithm_name == "2":
-        algorithm_name = "Greedy"
-    elif algorithm_name == "3":
-        algorithm_name = "Backtracking"
-
-    graphs = generate_all_graphs(501)
-    run_simulation(graphs, output_mode, algorithm_name)
-    
+    algorithm_names = list(ALGORITHMS)
+    menu = "".join(f"{i}. {name}\n" for i, name in enumerate(algorithm_names, 1))
+    valid_options = [str(i) for i in range(1, len(algorithm_names) + 1)]
+    algorithm_name = input("Enter the algorithm number to be used: \n" + menu)
+    while algorithm_name not in valid_options:
+        algorithm_name = input("Invalid input. Please enter a valid algorithm number: \n" + menu)
+    algorithm_name = algorithm_names[int(algorithm_name) - 1]
+    if algorithm_name in WARM_START_ALGORITHMS and not warm_start:
+        warm_start = input("Warm start from the Greedy clique? (y/n): ").strip().lower() == "y"
+    algorithm_options = {}
+    if algorithm_name == "LocalSearch":
+        budget = input("Local search time budget per instance, in seconds (Enter for 10000 iterations): ").strip()
+        while budget and not is_positive_number(budget):
+            budget = input("Invalid input. Please enter a number of seconds (or Enter for 10000 iterations): ").strip()
+        algorithm_options["LocalSearch"] = local_search_options(budget=float(budget) if budget else None)
+
+    graphs = generate_all_graphs(501, replicates=REPLICATES, workers=workers)
+    run_simulation(graphs, output_mode, [algorithm_name], workers, warm_start=warm_start, benchmark=benchmark, schedule=schedule,
+                   algorithm_options=algorithm_options)
+    plot_results(algorithm_name, f"{algorithm_name}_WarmStart" if warm_start else algorithm_name)
+    if not issubclass(ALGORITHMS[algorithm_name], FusedSearch):  # The fused runs write their own comparison
+        compare_greedy_backtracking_accuracy("results/Greedy_results.csv", "results/Backtracking_results.csv", "results/comparison")
+
+
+def local_search_options(iterations=None, budget=None):
+    """Opções do LocalSearch; com um orçamento de tempo (segundos) e sem iterações, só o orçamento conta."""
+    options = {}
+    if budget is not None:
+        options.update(time_budget=budget, max_iterations=None)
+    if iterations is not None:
+        options["max_iterations"] = iterations
+    return options
+
+
+def is_positive_number(value):
+    try:
+        return float(value) > 0
+    except ValueError:
+        return False
+
+
+def plot_results(algorithm_name, run_name):
     # Load the CSV data for plotting
-    csv_filename = f"results/{algorithm_name}_results.csv"
+    csv_filename = f"results/{run_name}_results.csv"
     data = pd.read_csv(csv_filename)
+    data = data[~data["Timed_Out"]]  # Timed out rows only hold the best clique found so far
     
     # Generate and save plots
-    plot_output_dir = f"results/plots/{algorithm_name}"
+    plot_output_dir = f"results/plots/{run_name}"
     os.makedirs(plot_output_dir, exist_ok=True)
 
-    if algorithm_name == "Greedy":
+    if algorithm_name in ("Greedy", "BitsetGreedy", "PrunedGreedy"):
         plot_vertices_vs_search_time_greedy(data, plot_output_dir)
         plot_vertices_vs_operations_count_greedy(data, plot_output_dir)
     elif algorithm_name == "Exhaustive":
@@ -50,113 +127,299 @@ def main(output_mode=False):
     plot_vertices_vs_tested_solutions(data, plot_output_dir)
     plot_edge_prob_vs_max_clique_weight(data, plot_output_dir)
     plot_vertices_vs_max_clique_weight(data, plot_output_dir)
-    compare_greedy_backtracking_accuracy("results/Greedy_results.csv", "results/Backtracking_results.csv", "results/comparison")
 
-def generate_all_graphs(max_vertices):
-    if os.path.exists("graph/data/generated_graphs.pkl"):
-        with open('graph/data/generated_graphs.pkl', 'rb') as f:
-            return pickle.load(f)
-    else:
-        graphs = []
+def generate_all_graphs(max_vertices, min_vertices=5, probabilities=EDGE_PROBABILITIES, replicates=1, workers=1, shard=None):
+    """Instâncias (grafo, probabilidade, réplica) com min_vertices <= vértices < max_vertices.
+
+    Com mais de um worker, as instâncias em falta no GraphStore são geradas em paralelo logo de
+    início; caso contrário, cada grafo é lido (ou gerado e guardado) apenas quando a iteração
+    chega a ele. Com shard=(i, n), só é devolvida (e gerada) a parte i (de 1 a n) das instâncias.
+    """
+    store = GraphStore()
+    configs = [(vertices_count, edges_probability, replicate)
+               for vertices_count in range(min_vertices, max_vertices)
+               for edges_probability in probabilities
+               for replicate in range(replicates)]
+    if shard is not None:
+        # Distribuição alternada, para que cada parte tenha instâncias de todos os tamanhos
+        shard_index, shard_count = shard
+        configs = configs[shard_index - 1::shard_count]
+    graphs = GraphSet(store, configs)
+    new_configs = {config for config in configs if config not in store}  # Registos que vão ser (re)gerados
+
+    if workers > 1:
         print("Generating Graphs...")
-        start = time.time()
-        for vertices_count in range(5, max_vertices):
-            for edges_probability in [0.125, 0.25, 0.5, 0.75]:
-                G = generate_graph(vertices_count, edges_probability)
-                graphs.append((G, edges_probability))  # Assegurar que cada elemento é (grafo, probabilidade)
-                progress = vertices_count * 100 / max_vertices
-                print(f"Progress (%): {round(progress, 2)}", end='\r')
-
-                if vertices_count <= 10:  # Ajuste este limite conforme necessário
-                    filename = f"graph_{vertices_count}_prob_{int(edges_probability*100)}.png"
-                    save_graph_example(G, folder="results/graphExamples", filename=filename)
-        end = time.time()
-        print(f"Generated {len(graphs)} graphs in {end - start} seconds")
-        
-        # Salvar gráficos
-        with open('graph/data/generated_graphs.pkl', 'wb') as f:
-            pickle.dump(graphs, f)
-        return graphs
+        store.generate(configs, workers)
 
+    # Guardar imagens de exemplo dos grafos pequenos que ainda não existam, ou cujo registo no
+    # GraphStore é novo (a imagem antiga mostraria outro grafo)
+    for config in configs:
+        vertices_count, edges_probability, replicate = config
+        if vertices_count <= 10 and replicate == 0:  # Ajuste este limite conforme necessário
+            filename = f"graph_{vertices_count}_prob_{int(edges_probability*100)}.png"
+            if config in new_configs or not os.path.exists(os.path.join("results/graphExamples", filename)):
+                G = store.get(vertices_count, edges_probability)
+                save_graph_example(G.to_networkx(), folder="results/graphExamples", filename=filename)
 
-def run_simulation(graphs, output_mode, algorithm_name):
-    print(f"Max Weight Clique - {algorithm_name} Algorithm")
-    print()
+    return graphs
+
+
+def run_simulation(graphs, output_mode, algorithm_names, workers=1, resume=True, warm_start=False, columnar=False, benchmark=None,
+                   schedule=False, shard=None, instrumentation=None, profiler=None, timeout=SEARCH_TIMEOUT, algorithm_options=None):
+    """Correr os algoritmos `algorithm_names` sobre as instâncias `graphs`, cada um com o seu CSV.
+
+    `algorithm_options` tem, por nome de algoritmo, argumentos extra do construtor (por exemplo,
+    o orçamento do LocalSearch).
 
-    # Configurar arquivos de saída
-    txt_filename = f"results/{algorithm_name}_results.txt"
-    csv_filename = f"results/{algorithm_name}_results.csv"
+    Cada instância é carregada uma só vez e resolvida por todos os algoritmos que ainda não a têm
+    no seu CSV antes de passar à seguinte. Com o escalonador, que tem um modelo de custo (e uma
+    ordem das instâncias) por algoritmo, os algoritmos são corridos um de cada vez.
+    """
+    if schedule and len(algorithm_names) > 1:
+        for algorithm_name in algorithm_names:
+            run_simulation(graphs, output_mode, [algorithm_name], workers, resume, warm_start, columnar, benchmark, schedule,
+                           shard, instrumentation, profiler, timeout, algorithm_options)
+            print()
+        return
 
-    # Limpar o arquivo TXT antes de começar a escrever, se estiver no modo de saída
-    if output_mode:
-        open(txt_filename, "w").close()
+    runs = []  # (classe, warm start, opções, configurações por resolver) de cada algoritmo, para os runners
+    outputs = []  # (nome, run_name, csv_filename, headers, extra_headers, checkpoint) de cada algoritmo
+    selected = set()  # Configurações que pelo menos um algoritmo ainda tem de resolver
+    for algorithm_name in algorithm_names:
+        # Escolher algoritmo
+        if algorithm_name not in ALGORITHMS:
+            raise NotImplemented()
+        algorithm_class = ALGORITHMS[algorithm_name]
+        algorithm_warm_start = warm_start and algorithm_name in WARM_START_ALGORITHMS
 
-    # Abrir arquivo TXT para adicionar dados
-    output_file = open(txt_filename, "a")
+        print(f"Max Weight Clique - {algorithm_name} Algorithm" + (" (warm start from Greedy)" if algorithm_warm_start else ""))
 
-    # Criar diretório para CSV, se necessário
-    os.makedirs(os.path.dirname(csv_filename), exist_ok=True)
+        # Configurar arquivos de saída (o warm start tem resultados próprios)
+        run_name = f"{algorithm_name}_WarmStart" if algorithm_warm_start else algorithm_name
+        if shard is not None:
+            run_name += "_shard{}of{}".format(*shard)  # Cada parte tem o seu CSV (e checkpoint)
+        csv_filename = f"results/{run_name}_results.csv"
 
-    # Abrir o arquivo CSV e escrever cabeçalhos
-    with open(csv_filename, mode='w', newline='') as csv_file:
-        csv_writer = csv.writer(csv_file)
-        headers = ["Vertices", "Edges_Prob", "Max_Weight", "Ops_Count", "Tested_Solutions", "Search_Time"]
-        csv_writer.writerow(headers)
+        headers = ["Vertices", "Edges_Prob", "Replicate", "Max_Weight", "Ops_Count", "Tested_Solutions", "Search_Time", "Timed_Out",
+                   "Time_Limit"]
+        extra_headers = (["Warm_Start_Weight", "Warm_Start_Prunes"] if algorithm_warm_start else []) + list(algorithm_class.STATS)
+        if benchmark is not None:
+            extra_headers += BENCHMARK_STATS  # Search_Time passa a ser a mediana das repetições
+        if instrumentation is not None:
+            extra_headers += instrumentation.columns()  # Contadores comuns a todos os algoritmos
+        if profiler is not None:
+            extra_headers += profiler.columns()
+        headers += extra_headers
 
-        # Escrever cabeçalhos no TXT
-        if not output_mode:
-            print("Vertices\tEdges_Prob.\tMax_Weight\tOps._Count\tTested_Solutions\tSearch_Time".expandtabs(30))
-        else:
-            output_file.write("Vertices\tEdges_Prob.\tMax_Weight\tOps._Count\tTested_Solutions\tSearch_Time\n".expandtabs(30))
+        # Criar diretório para os resultados, se necessário
+        os.makedirs(os.path.dirname(csv_filename), exist_ok=True)
 
-        for graph_count, (graph, edges_prob) in enumerate(graphs, 1):
+        # Ignorar as instâncias maiores do que o algoritmo suporta
+        algorithm_graphs = graphs
+        if algorithm_class.MAX_VERTICES is not None:
+            algorithm_graphs = instances_up_to(graphs, algorithm_class.MAX_VERTICES)
+            if len(algorithm_graphs) < len(graphs):
+                print(f"Skipping {len(graphs) - len(algorithm_graphs)} instances with more than {algorithm_class.MAX_VERTICES} "
+                      f"vertices (not supported by {algorithm_name})")
+
+        # Retomar a partir dos resultados já gravados, se existirem
+        checkpoint = load_checkpoint(csv_filename, headers, timeout) if resume else None
+        if checkpoint is not None:
+            completed, timed_out_vertices = checkpoint
+            algorithm_graphs = pending_instances(algorithm_graphs, completed, timed_out_vertices)
+            print(f"Resuming: {len(completed)} instances already in {csv_filename}, {len(algorithm_graphs)} left")
+
+        configs = set(instance_configs(algorithm_graphs))
+        selected |= configs
+        runs.append((algorithm_class, algorithm_warm_start, (algorithm_options or {}).get(algorithm_name, {}), configs))
+        outputs.append((algorithm_name, run_name, csv_filename, headers, extra_headers, checkpoint))
+    print()
+
+    # Só as instâncias que algum algoritmo tem de resolver são carregadas
+    graphs = select_instances(graphs, selected)
+
+    # Com o escalonador, a ordem das instâncias vem do modelo de custo (ajustado aos resultados já
+    # gravados e atualizado a cada resultado), e um timeout não termina a varredura
+    scheduler = None
+    if schedule:
+        _, _, csv_filename, _, _, checkpoint = outputs[0]
+        model = CostModel.from_csv(csv_filename) if checkpoint is not None else CostModel()
+        graphs = scheduler = Scheduler(graphs, model, timeout)
+
+    if workers > 1:
+        results = run_parallel(graphs, runs, workers, timeout, benchmark, instrumentation, profiler)
+    else:
+        results = run_sequential(graphs, runs, timeout, benchmark, not schedule, instrumentation, profiler)
+
+    # O CSV (escrito em lotes) é a única fonte dos resultados; no modo de saída o TXT é gerado
+    # a partir dele no fim, caso contrário as linhas são mostradas no ecrã
+    progress = ProgressPrinter(len(graphs))
+    with ExitStack() as stack:
+        sinks = [stack.enter_context(ResultsSink(csv_filename, headers, append=checkpoint is not None, echo=not output_mode))
+                 for _, _, csv_filename, headers, _, checkpoint in outputs]
+
+        for graph_count, (instance, search_results) in enumerate(results, 1):
+            graph, edges_prob, *replicate = instance
+            replicate = replicate[0] if replicate else 0
             vertices_count = graph.number_of_nodes()
 
-            # Escolher algoritmo
-            if algorithm_name == "Exhaustive":
-                algorithm = ExhaustiveSearch(graph)
-            elif algorithm_name == "Greedy":
-                algorithm = GreedySearch(graph)
-            elif algorithm_name == "Backtracking":
-                algorithm = BacktrackingSearch(graph)
-            else:
-                raise NotImplemented()
-
-            start_time_search = time.time()
-            max_clique, operations_count, tested_solutions = algorithm.perform_search()
-            end_time_search = time.time()
-
-            search_delta_time = end_time_search - start_time_search
-
-            # Criar resultado como lista de dados para CSV
-            result = [
-                vertices_count,
-                edges_prob,
-                max_clique.weight if max_clique else 0,
-                operations_count,
-                tested_solutions,
-                search_delta_time
-            ]
-
-            # Escrever resultado no arquivo CSV
-            csv_writer.writerow(result)
-
-            # Formatar resultado para o TXT
-            result_str = f"{vertices_count}\t{edges_prob}\t{result[2]}\t{operations_count}\t{tested_solutions}\t{search_delta_time}".expandtabs(30)
-
-            # Escrever resultado no arquivo TXT e na tela, se não estiver no modo de saída
-            if not output_mode:
-                print(result_str)
-            else:
-                output_file.write(result_str + "\n")
-                print(f"Progress (%): {round(graph_count * 100 / len(graphs), 2)}", end='\r')
-
-            # Parar se o tempo de busca exceder 120 segundos
-            if search_delta_time > 120:
-                print("Stopped due to timeout...")
-                break
-
-    output_file.close()
+            for run_index, search_result in search_results.items():
+                algorithm_name, run_name, _, _, extra_headers, _ = outputs[run_index]
+                sink = sinks[run_index]
+                if scheduler is not None:
+                    scheduler.record(instance, search_result)
+
+                # Instância terminada à força por não respeitar o tempo limite
+                if search_result is None:
+                    print(f"Killed after timeout: {algorithm_name}, {vertices_count} vertices, edges prob {edges_prob}, "
+                          f"replicate {replicate}")
+
+                    # Registar a instância como timeout (sem clique nem tempo de busca), para que a
+                    # retoma não a volte a correr e salte as maiores com a mesma probabilidade
+                    sink.write([vertices_count, edges_prob, replicate, 0, 0, 0, "", True, timeout] + [""] * len(extra_headers))
+                    continue
+
+                max_clique, operations_count, tested_solutions, search_delta_time, timed_out, stats = search_result
+                if "Profile" in stats:
+                    profile_filename = profiler.save(stats["Profile"], run_name, vertices_count, edges_prob, replicate)
+                    print(f"Profile of a slow instance saved to {profile_filename}")
+
+                # Criar resultado como lista de dados para CSV
+                sink.write([
+                    vertices_count,
+                    edges_prob,
+                    replicate,
+                    max_clique.weight if max_clique else 0,
+                    operations_count,
+                    tested_solutions,
+                    search_delta_time,
+                    timed_out,
+                    timeout
+                ] + [stats[header] for header in extra_headers])
+
+                if timed_out:
+                    print(f"Timeout: {algorithm_name}, {vertices_count} vertices, edges prob {edges_prob}, replicate {replicate} "
+                          f"(best clique so far recorded)")
+
+            if output_mode:
+                progress.update(graph_count)
+
+    if scheduler is not None and scheduler.skipped:
+        print(f"Skipped {len(scheduler.skipped)} instances predicted to exceed the {timeout}s budget")
+
+    for algorithm_name, run_name, csv_filename, _, _, _ in outputs:
+        if output_mode:
+            render_txt(csv_filename, f"results/{run_name}_results.txt")
+        if issubclass(ALGORITHMS[algorithm_name], FusedSearch):
+            fused_accuracy_comparison(csv_filename, f"results/comparison/{run_name}")
+        if columnar:
+            print(f"Columnar results: {export_columnar(csv_filename)}")
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(description="Max Weight Clique simulations (interactive menu when no command is given).")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="Run one or more algorithms over a selection of instances")
+    run.add_argument("--algo", required=True, type=parse_algorithms,
+                     help="Comma-separated algorithm names (case-insensitive): " + ", ".join(ALGORITHMS))
+    run.add_argument("--vertices", type=parse_vertex_range, default=(5, 501),
+                     help="Vertex counts MIN:MAX, MAX excluded (default: 5:501)")
+    run.add_argument("--probs", type=parse_probabilities, default=EDGE_PROBABILITIES,
+                     help="Comma-separated edge probabilities (default: %(default)s)")
+    run.add_argument("--replicates", type=int, default=REPLICATES, help="Graphs per (vertices, probability) (default: %(default)s)")
+    run.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parallel instances (default: %(default)s)")
+    run.add_argument("--shard", type=parse_shard, help="Run only part I of N of the instances, as I/N (1 <= I <= N)")
+    run.add_argument("--timeout", type=float, default=SEARCH_TIMEOUT, help="Time limit per instance, in seconds (default: %(default)s)")
+    run.add_argument("--warm-start", action="store_true", help="Warm start from the Greedy clique (algorithms that support it)")
+    run.add_argument("--repeats", type=int, help="Benchmark each instance with this many measured repetitions")
+    run.add_argument("--warmups", type=int, default=1, help="Unmeasured repetitions before a benchmark (default: %(default)s)")
+    run.add_argument("--pin-cpu", action="store_true", help="With --repeats, pin each instance to its own CPU (Linux only)")
+    run.add_argument("--keep-gc", action="store_true", help="With --repeats, leave the garbage collector on while measuring")
+    run.add_argument("--ls-iterations", type=int, metavar="N",
+                     help="LocalSearch: stop after N moves (default: 10000, or no limit with --ls-budget)")
+    run.add_argument("--ls-budget", type=float, metavar="SECONDS", help="LocalSearch: stop after this many seconds per instance")
+    run.add_argument("--schedule", action="store_true", help="Order and skip instances with the runtime cost model")
+    run.add_argument("--instrument", action="store_true", help="Add the common search counters to the results")
+    run.add_argument("--depth-histogram", action="store_true", help="With --instrument, also the depth histogram of the search")
+    run.add_argument("--incumbent-trace", action="store_true", help="With --instrument, also when each better clique was found")
+    run.add_argument("--profile-threshold", type=float, metavar="SECONDS",
+                     help="Save a cProfile profile of the instances slower than this (in results/profiles)")
+    run.add_argument("--peak-memory", action="store_true", help="Add the peak memory of each search (Peak_Mem_Bytes)")
+    run.add_argument("--columnar", action="store_true", help="Also export the results in a columnar format")
+    run.add_argument("--no-resume", dest="resume", action="store_false", help="Overwrite the results instead of resuming them")
+    run.add_argument("--plots", action="store_true", help="Generate the plots of each algorithm at the end")
+    run.add_argument("--verbose", action="store_true", help="Print every result row instead of the progress")
+    return parser.parse_args(argv)
+
+
+def parse_algorithms(value):
+    names = {name.lower(): name for name in ALGORITHMS}
+    algorithm_names = []
+    for name in value.split(","):
+        if name.strip().lower() not in names:
+            raise argparse.ArgumentTypeError(f"unknown algorithm '{name}' (choose from {', '.join(ALGORITHMS)})")
+        algorithm_names.append(names[name.strip().lower()])
+    return algorithm_names
+
+
+def parse_vertex_range(value):
+    try:
+        min_vertices, max_vertices = (int(bound) for bound in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected MIN:MAX, got '{value}'")
+    if not 1 <= min_vertices < max_vertices:
+        raise argparse.ArgumentTypeError(f"empty vertex range '{value}'")
+    return min_vertices, max_vertices
+
+
+def parse_probabilities(value):
+    try:
+        probabilities = [float(probability) for probability in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated probabilities, got '{value}'")
+    if not all(0 < probability <= 1 for probability in probabilities):
+        raise argparse.ArgumentTypeError(f"probabilities must be in (0, 1], got '{value}'")
+    return probabilities
+
+
+def parse_shard(value):
+    try:
+        shard_index, shard_count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected I/N, got '{value}'")
+    if not 1 <= shard_index <= shard_count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and N, got '{value}'")
+    return shard_index, shard_count
+
+
+def run_command(arguments):
+    """Correr os algoritmos escolhidos sobre as mesmas instâncias, cada uma carregada uma só vez."""
+    benchmark = None
+    if arguments.repeats:
+        benchmark = Benchmark(arguments.repeats, arguments.warmups, disable_gc=not arguments.keep_gc, pin_cpu=arguments.pin_cpu)
+    instrumentation = Instrumentation(arguments.depth_histogram, arguments.incumbent_trace) if arguments.instrument else None
+    profiler = None
+    if arguments.profile_threshold is not None or arguments.peak_memory:
+        profiler = Profiler(arguments.profile_threshold, arguments.peak_memory)
+    min_vertices, max_vertices = arguments.vertices
+
+    # Só as instâncias selecionadas (e desta parte) são geradas ou lidas do GraphStore
+    graphs = generate_all_graphs(max_vertices, min_vertices, arguments.probs, arguments.replicates, arguments.workers, arguments.shard)
+
+    algorithm_options = {"LocalSearch": local_search_options(arguments.ls_iterations, arguments.ls_budget)}
+    run_simulation(graphs, not arguments.verbose, arguments.algo, arguments.workers, arguments.resume, arguments.warm_start,
+                   arguments.columnar, benchmark, arguments.schedule, arguments.shard, instrumentation, profiler, arguments.timeout,
+                   algorithm_options)
+    print()
+    if arguments.plots and arguments.shard is None:
+        for algorithm_name in arguments.algo:
+            warm_start = arguments.warm_start and algorithm_name in WARM_START_ALGORITHMS
+            plot_results(algorithm_name, f"{algorithm_name}_WarmStart" if warm_start else algorithm_name)
+
 
 if __name__ == "__main__":
-    main(output_mode=True)
\ No newline at end of file
+    arguments = parse_arguments(sys.argv[1:])
+    if arguments.command == "run":
+        run_command(arguments)
+    else:
+        main(output_mode=True, workers=os.cpu_count() or 1)
\ No newline at end of file
@@ -0,0 +1,14 @@
+from setuptools import Extension, setup
+
+# Only builds the optional native kernel of the searches, in place:
+#
+#     python setup.py build_ext --inplace
+#
+# Without it, the solvers use their pure Python implementation.
+
+setup(
+    name="mei-aa-p1",
+    ext_modules=[
+        Extension("algorithms.native.cliqueKernel", ["algorithms/native/cliqueKernel.c"], extra_compile_args=["-O3"]),
+    ],
+)
@@ -0,0 +1,87 @@
+import gc
+import os
+import time
+import numpy as np
+
+# Medição do tempo de busca com várias repetições.
+#
+# Com uma única medição, o tempo das instâncias pequenas (microssegundos) é dominado pelo ruído
+# e pela resolução do relógio. Com um Benchmark:
+#
+# - cada instância é resolvida `warmups` vezes sem medir e depois `repeats` vezes medindo, com
+#   time.perf_counter_ns à volta de perform_search (o algoritmo é criado de novo em cada
+#   repetição, fora da medição);
+# - o garbage collector é chamado antes de cada repetição e desligado durante a medição; o
+#   tempo limite da repetição só começa depois dele, imediatamente antes de perform_search;
+# - opcionalmente, o processo fica preso a um CPU (os.sched_setaffinity, só em Linux).
+#
+# O resultado guardado é o da última repetição, com Search_Time igual à mediana dos tempos, e
+# as colunas extra Search_Time_Q1, Search_Time_Q3 e Search_Time_IQR (em segundos), usadas pelos
+# gráficos para desenhar barras de erro.
+
+STATS = ("Search_Time_Q1", "Search_Time_Q3", "Search_Time_IQR")
+
+
+class Benchmark:
+
+    def __init__(self, repeats: int = 5, warmups: int = 1, disable_gc: bool = True, pin_cpu: bool = False):
+        self.repeats = repeats
+        self.warmups = warmups
+        self.disable_gc = disable_gc
+        self.pin_cpu = pin_cpu  # Prender cada instância a um CPU (um por worker)
+
+    def measure(self, create_algorithm, start_search, cpu: int | None = None):
+        """Resolver com o algoritmo criado por `create_algorithm` e medir as repetições.
+
+        `start_search(algoritmo)` é chamada imediatamente antes de cada perform_search (para
+        começar a contar o tempo limite). Devolve (algoritmo da última repetição, resultado de
+        perform_search, tempos em segundos).
+        """
+        previous_affinity = None
+        if self.pin_cpu and cpu is not None and hasattr(os, "sched_setaffinity"):
+            previous_affinity = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {cpu})
+
+        try:
+            for _ in range(self.warmups):
+                algorithm = create_algorithm()
+                start_search(algorithm)
+                algorithm.perform_search()
+
+            samples = []
+            for _ in range(self.repeats):
+                algorithm = create_algorithm()
+                gc.collect()
+                gc_was_enabled = gc.isenabled()
+                if self.disable_gc:
+                    gc.disable()
+                try:
+                    start_search(algorithm)
+                    start_time_search = time.perf_counter_ns()
+                    result = algorithm.perform_search()
+                    end_time_search = time.perf_counter_ns()
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+                samples.append((end_time_search - start_time_search) / 1e9)
+
+                # Uma repetição que atingiu o tempo limite não é repetida
+                if algorithm.timed_out:
+                    break
+        finally:
+            if previous_affinity is not None:
+                os.sched_setaffinity(0, previous_affinity)
+
+        return algorithm, result, samples
+
+
+def summarize(samples: list[float]) -> tuple[float, dict]:
+    """Mediana dos tempos e as colunas extra com os quartis e a amplitude interquartil."""
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    return float(median), {"Search_Time_Q1": float(q1), "Search_Time_Q3": float(q3), "Search_Time_IQR": float(q3 - q1)}
+
+
+def available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
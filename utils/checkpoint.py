@@ -0,0 +1,146 @@
+import csv
+import os
+from graph.graphStore import GraphSet
+
+# Checkpointing of the simulation results.
+#
+# The results CSV of an algorithm is the checkpoint itself: rows are written by ResultsSink
+# (utils/resultsSink.py) in batches, every 64 rows or 5 seconds, so an interrupted run loses at
+# most the batch in progress (and a last row left half-written, which is dropped). A restarted
+# run reads the file back to skip the (Vertices, Edges_Prob, Replicate) instances that are
+# already there and solves the lost ones again. Since each algorithm has its own results file,
+# this skips the (vertices, prob, algorithm) triples (for each replicate) already solved.
+#
+# A results file written with different columns (e.g. by a run with other options) cannot be
+# resumed; it is moved aside to a .bak file instead of being overwritten.
+#
+# Every row records the time limit it was solved with (Time_Limit). A timed out (or killed)
+# instance counts as done, and blocks the larger instances with the same edge probability, only
+# for runs with the same or a shorter limit: with a longer one, its row is removed from the file
+# and the instance is solved again, together with the larger ones it was blocking.
+
+
+def load_checkpoint(csv_filename, headers, time_limit=None):
+    """Read the instances already present in `csv_filename`.
+
+    Returns a tuple (completed, timed_out_vertices) where `completed` is the set of
+    (vertices, edges_prob, replicate) already solved and `timed_out_vertices` maps each edge probability to
+    the smallest vertex count that timed out. The rows that timed out with a Time_Limit shorter
+    than `time_limit` are dropped from the file (and from both). Returns None when there is
+    nothing to resume: the file does not exist, is empty, or was written with different columns
+    (then it is renamed with set_aside, so that the new run does not overwrite it).
+    """
+    if not os.path.exists(csv_filename):
+        return None
+
+    _drop_partial_row(csv_filename)
+
+    with open(csv_filename, newline='') as csv_file:
+        file_headers = next(csv.reader(csv_file), None)
+    if file_headers is None:
+        return None
+    if file_headers != headers:
+        print(f"{csv_filename} has different columns, moved to {set_aside(csv_filename)}")
+        return None
+
+    completed = set()
+    timed_out_vertices = {}
+    kept_rows = []
+    retried = 0
+    with open(csv_filename, newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        next(reader)
+
+        for row in reader:
+            if len(row) != len(headers):
+                continue
+            record = dict(zip(headers, row))
+            key = (int(record["Vertices"]), float(record["Edges_Prob"]), int(record.get("Replicate", 0)))
+            if record.get("Timed_Out") == "True":
+                if time_limit is not None and float(record["Time_Limit"]) < time_limit:
+                    retried += 1
+                    continue
+                timed_out_vertices[key[1]] = min(key[0], timed_out_vertices.get(key[1], key[0]))
+            completed.add(key)
+            kept_rows.append(row)
+
+    if retried:
+        _rewrite(csv_filename, headers, kept_rows)
+        print(f"Retrying {retried} instances of {csv_filename} that timed out with a shorter time limit")
+
+    return completed, timed_out_vertices
+
+
+def pending_instances(graphs, completed, timed_out_vertices):
+    """Instances that are not in the checkpoint and are not larger than one that already timed out."""
+    def is_pending(vertices_count, edges_prob, replicate=0):
+        if (vertices_count, float(edges_prob), replicate) in completed:
+            return False
+        return vertices_count <= timed_out_vertices.get(float(edges_prob), float('inf'))
+
+    # Um GraphSet é filtrado pelas configurações, sem carregar nenhum grafo
+    if isinstance(graphs, GraphSet):
+        return graphs.select(is_pending)
+
+    pending = []
+    for instance in graphs:
+        graph, edges_prob, *replicate = instance
+        if is_pending(graph.number_of_nodes(), edges_prob, *replicate):
+            pending.append(instance)
+    return pending
+
+
+def instance_config(instance):
+    """(vertices, edges_prob, replicate) of a (graph, edges_prob[, replicate]) instance."""
+    graph, edges_prob, *replicate = instance
+    return graph.number_of_nodes(), float(edges_prob), replicate[0] if replicate else 0
+
+
+def instance_configs(graphs):
+    """(vertices, edges_prob, replicate) of every instance, without loading the graphs of a GraphSet."""
+    if isinstance(graphs, GraphSet):
+        return [(vertices_count, float(edges_prob), replicate) for vertices_count, edges_prob, replicate in graphs.configs]
+    return [instance_config(instance) for instance in graphs]
+
+
+def select_instances(graphs, configs):
+    """Instances whose (vertices, edges_prob, replicate) are in `configs`, in their original order."""
+    if isinstance(graphs, GraphSet):
+        return graphs.select(lambda vertices_count, edges_prob, replicate: (vertices_count, float(edges_prob), replicate) in configs)
+    return [instance for instance in graphs if instance_config(instance) in configs]
+
+
+def instances_up_to(graphs, max_vertices):
+    """Instances with at most `max_vertices` vertices."""
+    if isinstance(graphs, GraphSet):
+        return graphs.select(lambda vertices_count, edges_prob, replicate: vertices_count <= max_vertices)
+    return [instance for instance in graphs if instance[0].number_of_nodes() <= max_vertices]
+
+
+def set_aside(csv_filename):
+    """Rename `csv_filename` to the first free name among .bak, .bak1, .bak2, ... and return it."""
+    backup_filename = csv_filename + ".bak"
+    suffix = 0
+    while os.path.exists(backup_filename):
+        suffix += 1
+        backup_filename = f"{csv_filename}.bak{suffix}"
+    os.rename(csv_filename, backup_filename)
+    return backup_filename
+
+
+def _rewrite(csv_filename, headers, rows):
+    """Replace the content of `csv_filename` with `rows`, through a temporary file."""
+    temporary_filename = csv_filename + ".tmp"
+    with open(temporary_filename, "w", newline='') as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(headers)
+        csv_writer.writerows(rows)
+    os.replace(temporary_filename, csv_filename)
+
+
+def _drop_partial_row(csv_filename):
+    """Truncate a last row left half-written by an interrupted run, so new rows start on a new line."""
+    with open(csv_filename, 'rb+') as csv_file:
+        content = csv_file.read()
+        if content and not content.endswith(b'\n'):
+            csv_file.truncate(content.rfind(b'\n') + 1)
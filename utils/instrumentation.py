@@ -0,0 +1,71 @@
+import time
+
+# Instrumentação das pesquisas, com contadores comparáveis entre algoritmos.
+#
+# O Ops_Count de cada algoritmo conta coisas diferentes (pares verificados no Exhaustive, arestas
+# verificadas no Greedy, nós expandidos no Backtracking). Com uma Instrumentation ligada
+# (SearchAlgorithm.instrument), as pesquisas contam também, da mesma forma em todos os algoritmos:
+#
+# - Adjacency_Checks: testes de adjacência (um bit de uma linha da matriz de adjacência, ou a
+#   interseção de um conjunto de candidatos com uma linha inteira, nas versões com bitsets)
+# - Nodes_Expanded: soluções parciais (cliques) geradas pela pesquisa
+# - Bound_Prunes: ramos cortados pelo limite superior do peso
+# - Incumbent_Updates: vezes que o melhor clique encontrado melhorou
+#
+# e, opcionalmente, o histograma das profundidades (tamanho do clique) dos nós expandidos e o
+# instante (segundos desde o início da pesquisa, marcado com start()) e o peso de cada melhoria
+# do melhor clique.
+#
+# Desligada (o caso por omissão), a instrumentação é None e os ciclos das pesquisas só fazem
+# um `if probe is not None`; os algoritmos com versão nativa só a usam sem instrumentação.
+
+COUNTERS = ("Adjacency_Checks", "Nodes_Expanded", "Bound_Prunes", "Incumbent_Updates")
+
+
+class Instrumentation:
+
+    def __init__(self, depth_histogram: bool = False, incumbent_trace: bool = False):
+        self.adjacency_checks = 0
+        self.nodes_expanded = 0
+        self.bound_prunes = 0
+        self.incumbent_updates = 0
+        self.depth_histogram = {} if depth_histogram else None  # profundidade -> nós expandidos
+        self.incumbent_trace = [] if incumbent_trace else None  # (segundos, peso)
+        self.start_time = time.perf_counter()
+
+    def start(self):
+        """Marcar o início da pesquisa (chamado imediatamente antes de perform_search)."""
+        self.start_time = time.perf_counter()
+
+    def fresh(self) -> "Instrumentation":
+        """Nova instrumentação, vazia, com as mesmas opções."""
+        return Instrumentation(self.depth_histogram is not None, self.incumbent_trace is not None)
+
+    def columns(self) -> list[str]:
+        """Colunas extra dos resultados com estas opções."""
+        return list(COUNTERS) + (["Depth_Histogram"] if self.depth_histogram is not None else []) + \
+            (["Incumbent_Trace"] if self.incumbent_trace is not None else [])
+
+    def node(self, depth: int):
+        self.nodes_expanded += 1
+        if self.depth_histogram is not None:
+            self.depth_histogram[depth] = self.depth_histogram.get(depth, 0) + 1
+
+    def incumbent(self, weight: int):
+        self.incumbent_updates += 1
+        if self.incumbent_trace is not None:
+            self.incumbent_trace.append((time.perf_counter() - self.start_time, weight))
+
+    def stats(self) -> dict:
+        """Valores das colunas (o histograma e o traço como texto "chave:valor" separado por espaços)."""
+        stats = {
+            "Adjacency_Checks": self.adjacency_checks,
+            "Nodes_Expanded": self.nodes_expanded,
+            "Bound_Prunes": self.bound_prunes,
+            "Incumbent_Updates": self.incumbent_updates,
+        }
+        if self.depth_histogram is not None:
+            stats["Depth_Histogram"] = " ".join(f"{depth}:{count}" for depth, count in sorted(self.depth_histogram.items()))
+        if self.incumbent_trace is not None:
+            stats["Incumbent_Trace"] = " ".join(f"{seconds:.6f}:{weight}" for seconds, weight in self.incumbent_trace)
+        return stats
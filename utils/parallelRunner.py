@@ -0,0 +1,292 @@
+import time
+import traceback
+from algorithms.bitsetGreedySearch import BitsetGreedySearch
+from utils.benchmark import available_cpus, summarize
+from utils.checkpoint import instance_config
+from utils.scheduler import WAIT
+from multiprocessing import Process, Pipe
+from multiprocessing.connection import wait
+
+# Runners used by run_simulation to solve the (graph, edges_prob) instances.
+#
+# Instances are tuples starting with (graph, edges_prob, ...); any extra items (such as the
+# replicate number) are passed through untouched. Each instance is solved by several runs, given
+# as (algorithm_class, warm_start, options, configs) tuples, where `options` are extra keyword
+# arguments of the algorithm (e.g. the budget of LocalSearch): a run only solves the instances whose
+# (vertices, edges_prob, replicate) are in its `configs` (all of them when it is None). The runs
+# of an instance are solved one after the other on the same graph, so it is loaded (and its
+# CompactGraph structures built) only once. Both runners yield (instance, results) in the same
+# order as the instances were given, where results maps the index of each run that solved the
+# instance to its result: (max_clique, operations_count, tested_solutions, search_time, timed_out, stats),
+# or None when the run had to be killed. The search time is measured with time.perf_counter
+# (monotonic, high resolution) around perform_search only. `stats` holds the extra columns of the
+# instance (the warm start ones and the STATS of the algorithm), keyed by column name.
+#
+# With warm_start, the exact solver (which must accept `initial_clique`) is seeded with the clique
+# found by the bitset greedy search, whose time is included in the search time. With a
+# Benchmark (utils/benchmark.py), every instance is measured over several repetitions and the
+# search time is their median (plus the time of the greedy search, which runs once and is added
+# to the quartiles as well); the parallel runner gives each worker its own CPU to pin to. With
+# an Instrumentation (utils/instrumentation.py), every search is instrumented with a fresh copy of
+# it and its counters are added to the stats (empty for the algorithms that are not instrumented).
+# With a Profiler (utils/profiling.py), the instance is solved once more after being measured, to
+# collect its peak memory and, for the slow ones, a cProfile profile (in stats["Profile"]).
+#
+# The timeout is given to the solvers as a time limit: they check it cooperatively and return
+# the best clique found so far with timed_out set. The parallel runner solves every instance
+# in its own process and, as a last resort, terminates the process of a run that is still
+# running KILL_GRACE seconds after its time limit, while the rest of the sweep goes on (the runs
+# of the instance that were not started yet are solved in a new process). Once a run times
+# out on an instance, it skips the larger instances with the same edge probability that were
+# not started yet, since it would not finish them either. The instances may come from a
+# Scheduler (utils/scheduler.py), which can hand out WAIT instead of an instance until the running
+# ones finish.
+#
+# An exception raised while solving an instance is not a timeout: the sequential runner lets it
+# propagate, and the parallel runner stops the other workers and raises a WorkerError with the
+# traceback from the worker.
+
+# How often (seconds) the parallel runner wakes up to check the deadlines of running instances
+POLL_INTERVAL = 0.05
+
+# Extra time (seconds) given to a solver to honor its time limit before its process is killed
+KILL_GRACE = 5
+
+
+def solve_instance(algorithm_class, graph, time_limit=None, warm_start=False, benchmark=None, cpu=None, instrumentation=None,
+                   profiler=None, algorithm_options=None):
+    stats = {}
+    options = dict(algorithm_options or {})
+    warm_start_time = 0
+
+    if warm_start:
+        start_time_warm_start = time.perf_counter()
+        initial_clique, _, _ = BitsetGreedySearch(graph).perform_search()
+        warm_start_time = time.perf_counter() - start_time_warm_start
+
+        options["initial_clique"] = initial_clique
+        stats["Warm_Start_Weight"] = initial_clique.weight if initial_clique is not None else 0
+    search_time_limit = time_limit - warm_start_time if time_limit is not None else None
+
+    def create_algorithm():
+        algorithm = algorithm_class(graph, **options)
+        if instrumentation is not None:
+            algorithm.instrument(instrumentation.fresh())
+        return algorithm
+
+    def start_search(algorithm):
+        # Right before perform_search, so the time limit (and the incumbent trace) does not run
+        # during the setup or a GC pause
+        algorithm.set_time_limit(search_time_limit)
+        if algorithm.instrumentation is not None:
+            algorithm.instrumentation.start()
+
+    if benchmark is None:
+        algorithm = create_algorithm()
+        start_search(algorithm)
+        start_time_search = time.perf_counter()
+        max_clique, operations_count, tested_solutions = algorithm.perform_search()
+        search_time = time.perf_counter() - start_time_search
+    else:
+        algorithm, (max_clique, operations_count, tested_solutions), samples = benchmark.measure(create_algorithm, start_search, cpu)
+        search_time, timing_stats = summarize(samples)
+        timing_stats["Search_Time_Q1"] += warm_start_time  # Same shift as the median, the IQR is unchanged
+        timing_stats["Search_Time_Q3"] += warm_start_time
+        stats.update(timing_stats)
+
+    if warm_start:
+        stats["Warm_Start_Prunes"] = algorithm.warm_start_prunes
+    stats.update(algorithm.search_stats())
+    if instrumentation is not None:
+        stats.update(algorithm.instrumentation.stats() if algorithm.INSTRUMENTED else dict.fromkeys(instrumentation.columns(), ""))
+    if profiler is not None:
+        stats.update(profiler.profile(create_algorithm, start_search, search_time))
+
+    return max_clique, operations_count, tested_solutions, warm_start_time + search_time, algorithm.timed_out, stats
+
+
+class WorkerError(RuntimeError):
+    """An instance failed with an exception in a worker process."""
+
+
+def _solve_in_worker(tasks, graph, time_limit, benchmark, cpu, instrumentation, profiler, connection):
+    # One message per run, in the order of `tasks`, so the parent knows which run is in progress
+    try:
+        for run_index, algorithm_class, warm_start, options in tasks:
+            try:
+                connection.send(("ok", run_index, solve_instance(algorithm_class, graph, time_limit, warm_start, benchmark, cpu,
+                                                                 instrumentation, profiler, options)))
+            except Exception:
+                connection.send(("error", run_index, traceback.format_exc()))
+                return
+    finally:
+        connection.close()
+
+
+def _runs_of(runs, instance):
+    """Indexes of the runs that solve `instance`."""
+    config = instance_config(instance)
+    return [run_index for run_index, (_, _, _, configs) in enumerate(runs) if configs is None or config in configs]
+
+
+def run_sequential(instances, runs, timeout, benchmark=None, stop_on_timeout=True, instrumentation=None, profiler=None):
+    """Solve the instances one after the other; each run stops after its first timeout (if stop_on_timeout)."""
+    cpu = available_cpus()[0]
+    stopped = set()  # Runs that timed out
+    for instance in instances:
+        results = {}
+        for run_index in _runs_of(runs, instance):
+            if run_index in stopped:
+                continue
+            algorithm_class, warm_start, options, _ = runs[run_index]
+            result = results[run_index] = solve_instance(algorithm_class, instance[0], timeout, warm_start, benchmark, cpu,
+                                                         instrumentation, profiler, options)
+
+            # Parar este algoritmo se o tempo de busca exceder o limite
+            if stop_on_timeout and (result[4] or result[3] > timeout):
+                stopped.add(run_index)
+        if results:
+            yield instance, results
+
+        if len(stopped) == len(runs):
+            return
+
+
+def run_parallel(instances, runs, workers, timeout, benchmark=None, instrumentation=None, profiler=None):
+    """Solve the instances in up to `workers` processes, yielding the results in input order."""
+    pending = _Lookahead(enumerate(instances))  # Graphs are only loaded when their instance starts
+    restarts = []  # (index, instance, run indexes) left over by a killed process, started first
+    running = {}  # connection -> (index, instance, process, start_time, slot, run indexes not finished yet)
+    free_slots = list(range(workers))  # Each running instance has its own slot (and CPU, when pinned)
+    cpus = available_cpus()
+    # Every warmup and repetition of a benchmark has the whole time limit
+    run_budget = timeout * (benchmark.warmups + benchmark.repeats) if benchmark is not None else timeout
+    if profiler is not None:
+        run_budget += timeout  # The profiling run
+    results = {}  # index -> {run index: result} of the instances not finished yet
+    finished = {}  # index -> (instance, results), or None for skipped instances
+    next_index = 0
+    timed_out_vertices = {}  # (run index, edges_prob) -> smallest vertex count that timed out
+
+    def finish(index, instance):
+        instance_results = results.pop(index)
+        finished[index] = (instance, instance_results) if instance_results else None
+
+    def abandon(index, instance, run_indexes):
+        # The first run was in progress when its process died; the others are started again
+        results[index][run_indexes[0]] = None
+        _register_timeout(timed_out_vertices, run_indexes[0], instance)
+        if len(run_indexes) > 1:
+            restarts.append((index, instance, run_indexes[1:]))
+        else:
+            finish(index, instance)
+
+    while restarts or pending or running:
+        # Start new instances while there are free workers
+        while (restarts or pending) and len(running) < workers:
+            if restarts:
+                index, instance, run_indexes = restarts.pop()
+            else:
+                index, instance = pending.pop()
+                if instance is WAIT:  # The Scheduler needs the results of the running instances first
+                    finished[index] = None
+                    break
+                run_indexes = _runs_of(runs, instance)
+                results[index] = {}
+            graph, edges_prob = instance[:2]
+            run_indexes = [run_index for run_index in run_indexes
+                           if graph.number_of_nodes() <= timed_out_vertices.get((run_index, edges_prob), float('inf'))]
+            if not run_indexes:
+                finish(index, instance)
+                continue
+
+            slot = free_slots.pop()
+            receiver, sender = Pipe(duplex=False)
+            tasks = [(run_index, *runs[run_index][:3]) for run_index in run_indexes]
+            process = Process(target=_solve_in_worker, daemon=True,
+                              args=(tasks, graph, timeout, benchmark, cpus[slot % len(cpus)], instrumentation, profiler, sender))
+            process.start()
+            sender.close()
+            running[receiver] = (index, instance, process, time.perf_counter(), slot, run_indexes)
+
+        # Collect the runs that finished
+        for receiver in (wait(list(running), timeout=POLL_INTERVAL) if running else []):
+            index, instance, process, _, slot, run_indexes = running[receiver]
+            try:
+                status, run_index, result = receiver.recv()
+            except EOFError:  # The worker died without sending a result
+                status = None
+
+            if status == "error":
+                for _, _, other_process, _, _, _ in running.values():
+                    other_process.terminate()
+                    other_process.join()
+                graph, edges_prob = instance[:2]
+                raise WorkerError(f"{runs[run_index][0].__name__} failed on {graph.number_of_nodes()} vertices, "
+                                  f"edges prob {edges_prob}:\n{result}")
+            if status == "ok":
+                results[index][run_index] = result
+                if result[4]:
+                    _register_timeout(timed_out_vertices, run_index, instance)
+                run_indexes = run_indexes[1:]
+                if run_indexes:  # The next run has its own time limit
+                    running[receiver] = (index, instance, process, time.perf_counter(), slot, run_indexes)
+                    continue
+
+            del running[receiver]
+            free_slots.append(slot)
+            receiver.close()
+            process.join()
+            if run_indexes:
+                abandon(index, instance, run_indexes)
+            else:
+                finish(index, instance)
+
+        # Kill the runs that did not honor their time limit
+        now = time.perf_counter()
+        for receiver, (index, instance, process, start_time, slot, run_indexes) in list(running.items()):
+            if now - start_time > run_budget + KILL_GRACE:
+                free_slots.append(slot)
+                process.terminate()
+                process.join()
+                receiver.close()
+                del running[receiver]
+                abandon(index, instance, run_indexes)
+
+        # Emit the results in the original order
+        while next_index in finished:
+            entry = finished.pop(next_index)
+            next_index += 1
+            if entry is not None:
+                yield entry
+
+
+def _register_timeout(timed_out_vertices, run_index, instance):
+    graph, edges_prob = instance[:2]
+    vertices_count = graph.number_of_nodes()
+    key = (run_index, edges_prob)
+    timed_out_vertices[key] = min(vertices_count, timed_out_vertices.get(key, vertices_count))
+
+
+class _Lookahead:
+    """Iterator wrapper that can tell whether there are items left without consuming them."""
+
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self._buffer = []
+
+    def __bool__(self):
+        if not self._buffer:
+            self._buffer.extend(next(self._iterator, _END) for _ in range(1))
+            if self._buffer[0] is _END:
+                self._buffer.clear()
+                return False
+        return True
+
+    def pop(self):
+        if not self:
+            raise IndexError("pop from an exhausted iterator")
+        return self._buffer.pop()
+
+
+_END = object()
@@ -4,6 +4,16 @@ import seaborn as sns
 import numpy as np
 from sklearn.metrics import r2_score
 
+def plot_search_time_error_bars(subset, mean_values, **kwargs):
+    """Q1-Q3 error bars around the search times, when the results come from a benchmark with repetitions."""
+    if 'Search_Time_Q1' not in subset or 'Search_Time_Q3' not in subset:
+        return
+    q1 = subset.groupby('Vertices')['Search_Time_Q1'].mean()
+    q3 = subset.groupby('Vertices')['Search_Time_Q3'].mean()
+    lower = (mean_values - q1).clip(lower=0)
+    upper = (q3 - mean_values).clip(lower=0)
+    plt.errorbar(mean_values.index, mean_values, yerr=[lower, upper], fmt='none', capsize=2, alpha=0.5, **kwargs)
+
 # GreedySearch
 def plot_vertices_vs_operations_count_greedy(data, output_dir):
     plt.figure(figsize=(10, 6))
@@ -42,6 +52,7 @@ def plot_vertices_vs_search_time_greedy(data, output_dir):
         
         # Scatter plot for actual points with reduced opacity
         plt.scatter(mean_values.index, mean_values, alpha=0.3, label=f'Edges Prob = {prob}')
+        plot_search_time_error_bars(subset, mean_values, color=plt.gca().collections[-1].get_facecolor()[0])
         
         # Quadratic fit
         x = mean_values.index
@@ -110,6 +121,7 @@ def plot_vertices_vs_search_time_075(data, output_dir):
     
     # Scatter plot for actual points
     plt.scatter(mean_values.index, mean_values, alpha=0.7, label='Edges Prob = 0.75', color='blue')
+    plot_search_time_error_bars(subset, mean_values, color='blue')
     
     # Exponential fit
     x = mean_values.index
@@ -175,6 +187,7 @@ def plot_vertices_vs_search_time_exhaustive(data, output_dir):
         
         # Scatter plot for actual points with reduced opacity
         plt.scatter(mean_values.index, mean_values, alpha=0.3, label=f'Edges Prob = {prob}')
+        plot_search_time_error_bars(subset, mean_values, color=plt.gca().collections[-1].get_facecolor()[0])
         
         # Exponential fit
         x = mean_values.index
@@ -0,0 +1,81 @@
+import cProfile
+import marshal
+import os
+import tracemalloc
+
+# Perfis (cProfile) e memória de pico (tracemalloc) das instâncias de run_simulation.
+#
+# Os dois instrumentos atrasam muito a pesquisa, por isso não são usados na execução medida: com
+# um Profiler, depois de resolvida (e medida), a instância é resolvida outra vez, com o mesmo
+# tempo limite, só para os recolher:
+#
+# - se a pesquisa demorou pelo menos `threshold` segundos, com o cProfile ligado; o perfil é
+#   guardado em `directory` (por omissão results/profiles) como um ficheiro .pstats, com o nome
+#   {algoritmo}_{vértices}_{probabilidade}_{réplica}.pstats, que se lê com pstats.Stats;
+# - com `memory`, em todas as instâncias, com o tracemalloc ligado; a coluna extra
+#   Peak_Mem_Bytes é o pico de memória alocada (em bytes) pela criação do algoritmo e pela
+#   pesquisa. A memória alocada pela versão nativa (fora do Python) não é contada.
+#
+# As instâncias terminadas à força (sem resultado) não têm perfil.
+
+STATS = ("Peak_Mem_Bytes",)
+
+
+class Profiler:
+
+    def __init__(self, threshold: float | None = 1.0, memory: bool = True, directory: str = "results/profiles"):
+        self.threshold = threshold  # Tempo de busca (segundos) a partir do qual há perfil (None desliga)
+        self.memory = memory
+        self.directory = directory
+
+    def columns(self) -> list[str]:
+        return list(STATS) if self.memory else []
+
+    def profile(self, create_algorithm, start_search, search_time: float) -> dict:
+        """Resolver outra vez com o algoritmo criado por `create_algorithm`, se for preciso.
+
+        `start_search(algoritmo)` é chamada imediatamente antes de perform_search, como no Benchmark.
+        Devolve as colunas extra e, se houve perfil, os dados do cProfile em "Profile".
+        """
+        use_cprofile = self.threshold is not None and search_time >= self.threshold
+        if not use_cprofile and not self.memory:
+            return {}
+
+        started_tracing = False
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        profiler = cProfile.Profile() if use_cprofile else None
+        try:
+            algorithm = create_algorithm()
+            start_search(algorithm)
+            if profiler is not None:
+                profiler.enable()
+            algorithm.perform_search()
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                if started_tracing:
+                    tracemalloc.stop()
+
+        stats = {}
+        if self.memory:
+            stats["Peak_Mem_Bytes"] = peak
+        if profiler is not None:
+            profiler.create_stats()
+            stats["Profile"] = profiler.stats
+        return stats
+
+    def save(self, profile: dict, run_name: str, vertices: int, edges_prob: float, replicate: int) -> str:
+        """Guardar os dados de um perfil no formato do pstats e devolver o caminho do ficheiro."""
+        os.makedirs(self.directory, exist_ok=True)
+        filename = os.path.join(self.directory, f"{run_name}_{vertices}_{edges_prob}_{replicate}.pstats")
+        with open(filename, "wb") as profile_file:
+            marshal.dump(profile, profile_file)  # O mesmo que cProfile.Profile.dump_stats
+        return filename
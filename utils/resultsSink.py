@@ -0,0 +1,106 @@
+import csv
+import os
+import time
+import numpy as np
+import pandas as pd
+
+# Escrita dos resultados de run_simulation.
+#
+# O CSV de cada algoritmo é a única fonte de verdade dos resultados (e também o checkpoint):
+#
+# - ResultsSink junta as linhas em memória e escreve-as em lotes (a cada `batch_size` linhas ou
+#   `flush_interval` segundos), em vez de escrever e fazer flush de cada linha; uma interrupção
+#   perde no máximo o lote corrente, que é recalculado ao retomar.
+# - O relatório TXT (colunas alinhadas com expandtabs(30)) é gerado a partir do CSV no fim, com
+#   render_txt, em vez de ser escrito linha a linha em paralelo com o CSV.
+# - export_columnar guarda uma cópia colunar dos resultados: Parquet se o pyarrow estiver
+#   instalado, senão um .npz comprimido com uma coluna por array.
+# - ProgressPrinter só atualiza a linha de progresso, no máximo, uma vez a cada `interval` segundos.
+
+# Nomes das colunas no relatório TXT, quando diferem dos do CSV
+TXT_LABELS = {"Edges_Prob": "Edges_Prob.", "Ops_Count": "Ops._Count"}
+
+
+def format_row(values) -> str:
+    return "\t".join(str(value) for value in values).expandtabs(30)
+
+
+class ResultsSink:
+
+    def __init__(self, csv_filename: str, headers: list[str], append: bool = False, batch_size: int = 64,
+                 flush_interval: float = 5.0, echo: bool = False):
+        self.headers = headers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.echo = echo  # Mostrar as linhas no ecrã (quando são escritas)
+        self.pending = []
+        self.last_flush = time.perf_counter()
+
+        self.csv_file = open(csv_filename, mode='a' if append else 'w', newline='')
+        self.csv_writer = csv.writer(self.csv_file)
+        if not append:
+            self.csv_writer.writerow(headers)
+        if echo:
+            print(format_row(TXT_LABELS.get(header, header) for header in headers))
+
+    def write(self, row: list):
+        self.pending.append(row)
+        if len(self.pending) >= self.batch_size or time.perf_counter() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self.csv_writer.writerows(self.pending)
+        self.csv_file.flush()
+        if self.echo:
+            for row in self.pending:
+                print(format_row(row))
+        self.pending.clear()
+        self.last_flush = time.perf_counter()
+
+    def close(self):
+        self.flush()
+        self.csv_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def render_txt(csv_filename: str, txt_filename: str):
+    """Escrever o relatório TXT com todas as linhas do CSV."""
+    with open(csv_filename, newline='') as csv_file, open(txt_filename, "w") as output_file:
+        reader = csv.reader(csv_file)
+        headers = next(reader, [])
+        output_file.write(format_row(TXT_LABELS.get(header, header) for header in headers) + "\n")
+        for row in reader:
+            output_file.write(format_row(row) + "\n")
+
+
+def export_columnar(csv_filename: str) -> str:
+    """Guardar os resultados do CSV num formato colunar e devolver o caminho do ficheiro."""
+    data = pd.read_csv(csv_filename)
+    base_filename = os.path.splitext(csv_filename)[0]
+    try:
+        import pyarrow  # noqa: F401 (necessário para o Parquet)
+    except ImportError:
+        np.savez_compressed(base_filename + ".npz", **{column: data[column].to_numpy() for column in data.columns})
+        return base_filename + ".npz"
+
+    data.to_parquet(base_filename + ".parquet", index=False)
+    return base_filename + ".parquet"
+
+
+class ProgressPrinter:
+
+    def __init__(self, total: int, interval: float = 1.0):
+        self.total = total
+        self.interval = interval
+        self.last_print = None
+
+    def update(self, count: int):
+        now = time.perf_counter()
+        if count == self.total or self.last_print is None or now - self.last_print >= self.interval:
+            print(f"Progress (%): {round(count * 100 / max(self.total, 1), 2)}", end='\r')
+            self.last_print = now
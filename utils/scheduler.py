@@ -0,0 +1,179 @@
+import csv
+import math
+import os
+import numpy as np
+from graph.graphStore import GraphSet
+
+# Escalonamento das instâncias de run_simulation com um modelo de custo.
+#
+# Para cada probabilidade de arestas, o CostModel ajusta, à medida que os resultados chegam, o
+# mesmo modelo exponencial usado nos gráficos (np.polyfit(vertices, log(tempo), 1)) aos tempos
+# de busca já medidos (incluindo os do checkpoint). Como cada algoritmo tem o seu CSV, há um
+# modelo por (algoritmo, probabilidade).
+#
+# O Scheduler entrega as instâncias aos runners uma a uma, decidindo no momento qual é a próxima:
+#
+# - enquanto não há modelo para uma probabilidade, as suas instâncias são corridas por ordem
+#   crescente de vértices, para obter pontos para o ajuste;
+# - o modelo só é usado depois de ajustado a MIN_FIT_POINTS tamanhos que cubram pelo menos
+#   MIN_FIT_SPAN vértices, para não decidir com base em dois ou três pontos com ruído;
+# - com modelo, corre primeiro as instâncias com maior custo previsto dentro do orçamento
+#   (longest-first, para equilibrar os workers); uma previsão dentro do orçamento para mais de
+#   MAX_EXTRAPOLATION vértices acima do maior tamanho medido não é de confiança, e essas
+#   instâncias só são corridas depois, por ordem crescente de vértices;
+# - as instâncias com custo previsto acima do orçamento ficam para o fim, e as que passam
+#   SKIP_MARGIN vezes o orçamento ficam à espera: a previsão é refeita a cada escolha, com o
+#   modelo reajustado, e só são ignoradas no fim da varredura (quando não há mais nada para
+#   correr nem resultados por chegar); enquanto só restam estas e há instâncias em curso, o
+#   Scheduler entrega WAIT em vez de uma instância, e o runner paralelo espera pelos resultados
+#   antes de voltar a pedir;
+# - depois de um timeout, as instâncias maiores com a mesma probabilidade são ignoradas.
+
+# Tempos mais curtos do que isto (segundos) são dominados pelo overhead e não entram no ajuste
+MIN_FIT_TIME = 1e-3
+
+# Número mínimo de tamanhos diferentes, e a diferença mínima (em vértices) entre o maior e o
+# menor, para ajustar o modelo
+MIN_FIT_POINTS = 4
+MIN_FIT_SPAN = 5
+
+# Distância máxima (em vértices) acima do maior tamanho medido a que uma previsão dentro do
+# orçamento é de confiança
+MAX_EXTRAPOLATION = 5
+
+# Instâncias com custo previsto acima de SKIP_MARGIN * orçamento só são corridas se o modelo mudar
+SKIP_MARGIN = 2.0
+
+# Entregue pelo Scheduler quando só restam instâncias inviáveis e há resultados por chegar
+WAIT = object()
+
+
+class CostModel:
+
+    def __init__(self):
+        self.observations = {}  # edges_prob -> {vertices: [tempos]}
+        self.fits = {}  # edges_prob -> (declive, ordenada na origem) de log(tempo) em função dos vértices
+
+    @classmethod
+    def from_csv(cls, csv_filename: str) -> "CostModel":
+        """Modelo inicial com os tempos dos resultados já gravados (instâncias sem timeout)."""
+        model = cls()
+        if os.path.exists(csv_filename):
+            with open(csv_filename, newline='') as csv_file:
+                for row in csv.DictReader(csv_file):
+                    try:
+                        if row.get("Timed_Out") != "True":
+                            model.add(int(row["Vertices"]), float(row["Edges_Prob"]), float(row["Search_Time"]))
+                    except (KeyError, TypeError, ValueError):
+                        continue  # Linha incompleta
+        return model
+
+    def add(self, vertices: int, edges_prob: float, search_time: float):
+        if search_time < MIN_FIT_TIME:
+            return
+        self.observations.setdefault(edges_prob, {}).setdefault(vertices, []).append(search_time)
+        self._fit(edges_prob)
+
+    def _fit(self, edges_prob: float):
+        points = self.observations[edges_prob]
+        if len(points) < MIN_FIT_POINTS or max(points) - min(points) < MIN_FIT_SPAN:
+            return
+        x = np.array(list(points))
+        y = np.log([np.median(times) for times in points.values()])
+        self.fits[edges_prob] = tuple(np.polyfit(x, y, 1).tolist())
+
+    def predict(self, vertices: int, edges_prob: float) -> float | None:
+        """Tempo de busca previsto (segundos), ou None se ainda não há modelo para a probabilidade."""
+        if edges_prob not in self.fits:
+            return None
+        slope, intercept = self.fits[edges_prob]
+        return math.exp(intercept + slope * vertices)
+
+
+class Scheduler:
+
+    def __init__(self, graphs, model: CostModel, budget: float):
+        self.model = model
+        self.budget = budget
+        self.skipped = []  # (vertices, edges_prob, replicate) que não foram corridas
+        self.timed_out_vertices = {}  # edges_prob -> menor número de vértices com timeout
+        self.in_flight = set()  # Configurações entregues cujo resultado ainda não foi registado
+
+        # Configurações (vértices, probabilidade, réplica) e como obter a instância de cada uma
+        if isinstance(graphs, GraphSet):
+            self.pending = {config: (lambda config=config: (graphs.store.get(*config), config[1], config[2])) for config in graphs.configs}
+        else:
+            self.pending = {}
+            for instance in graphs:
+                graph, edges_prob, *replicate = instance
+                config = (graph.number_of_nodes(), edges_prob, replicate[0] if replicate else 0)
+                self.pending[config] = lambda instance=instance: instance
+        self.total = len(self.pending)
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        while self.pending:
+            config = self._next_config()
+            if config is None:
+                break
+            if config is WAIT:
+                yield WAIT
+                continue
+            self.in_flight.add(config)
+            yield self.pending.pop(config)()
+
+        self.skipped.extend(self.pending)
+        self.pending.clear()
+
+    def record(self, instance, search_result):
+        """Atualizar o modelo com o resultado de uma instância (None se foi terminada à força)."""
+        graph, edges_prob, *replicate = instance
+        vertices = graph.number_of_nodes()
+        self.in_flight.discard((vertices, edges_prob, replicate[0] if replicate else 0))
+        if search_result is None or search_result[4]:
+            self.timed_out_vertices[edges_prob] = min(vertices, self.timed_out_vertices.get(edges_prob, vertices))
+            # O runner paralelo já não corre as maiores que lhe foram entregues (não há resultado)
+            self.in_flight = {config for config in self.in_flight if config[1] != edges_prob or config[0] <= vertices}
+        else:
+            self.model.add(vertices, edges_prob, search_result[3])
+
+    def _next_config(self):
+        deferred = []
+        feasible = []
+        unknown = []
+        beyond = []
+        infeasible = []
+        for config in list(self.pending):
+            vertices, edges_prob, _ = config
+            if vertices > self.timed_out_vertices.get(edges_prob, float('inf')):
+                self.skipped.append(config)
+                del self.pending[config]
+                continue
+
+            cost = self.model.predict(vertices, edges_prob)
+            if cost is None:
+                unknown.append(config)
+            elif cost > SKIP_MARGIN * self.budget:
+                infeasible.append(config)
+            elif cost > self.budget:
+                deferred.append((cost, config))
+            elif vertices > max(self.model.observations[edges_prob]) + MAX_EXTRAPOLATION:
+                beyond.append(config)
+            else:
+                feasible.append((cost, config))
+
+        # Sem modelo: as mais pequenas primeiro; com modelo: a de maior custo previsto
+        if unknown:
+            return min(unknown)
+        if feasible:
+            return max(feasible)[1]
+        if beyond:
+            return min(beyond)
+        # Só restam instâncias previstas acima do orçamento: os resultados em curso ainda podem mudar o modelo
+        if (deferred or infeasible) and self.in_flight:
+            return WAIT
+        if deferred:
+            return min(deferred)[1]
+        return None
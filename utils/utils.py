@@ -7,8 +7,17 @@ def compare_greedy_backtracking_accuracy(greedy_csv_path, backtracking_csv_path,
     greedy_df = pd.read_csv(greedy_csv_path)
     backtracking_df = pd.read_csv(backtracking_csv_path)
 
+    # Ignore timed out instances, their weights are not final
+    if 'Timed_Out' in greedy_df:
+        greedy_df = greedy_df[~greedy_df['Timed_Out']]
+    if 'Timed_Out' in backtracking_df:
+        backtracking_df = backtracking_df[~backtracking_df['Timed_Out']]
+
     # Merge the two dataframes on vertices and edges probability to align results
-    comparison_df = pd.merge(greedy_df, backtracking_df, on=["Vertices", "Edges_Prob"], suffixes=('_greedy', '_backtracking'))
+    merge_columns = ["Vertices", "Edges_Prob"]
+    if 'Replicate' in greedy_df and 'Replicate' in backtracking_df:
+        merge_columns.append('Replicate')
+    comparison_df = pd.merge(greedy_df, backtracking_df, on=merge_columns, suffixes=('_greedy', '_backtracking'))
 
     # Calculate the difference (delta) and accuracy percentage for each entry
     comparison_df['Delta'] = comparison_df['Max_Weight_backtracking'] - comparison_df['Max_Weight_greedy']
@@ -21,7 +30,25 @@ def compare_greedy_backtracking_accuracy(greedy_csv_path, backtracking_csv_path,
         'Max_Weight_greedy': 'Greedy Weight'
     })
     comparison_df = comparison_df[['Graph', 'Edges_Prob', 'Backtracking Weight', 'Greedy Weight', 'Delta', 'Accuracy (%)']]
+    save_accuracy_comparison(comparison_df, output_dir)
+
+
+def fused_accuracy_comparison(fused_csv_path, output_dir):
+    # The fused results already have both weights, the delta and the accuracy of every instance
+    fused_df = pd.read_csv(fused_csv_path)
+    fused_df = fused_df[~fused_df['Timed_Out']]
+
+    comparison_df = fused_df.rename(columns={
+        'Vertices': 'Graph',
+        'Max_Weight': 'Backtracking Weight',
+        'Greedy_Weight': 'Greedy Weight',
+        'Accuracy': 'Accuracy (%)'
+    })
+    comparison_df = comparison_df[['Graph', 'Edges_Prob', 'Backtracking Weight', 'Greedy Weight', 'Delta', 'Accuracy (%)']]
+    save_accuracy_comparison(comparison_df, output_dir)
+
 
+def save_accuracy_comparison(comparison_df, output_dir):
     # Calculate total accuracy (mean of the 'Accuracy (%)' column) and add as a final row
     total_accuracy = comparison_df['Accuracy (%)'].mean()
     total_row = pd.DataFrame([["Total", "", "", "", "", total_accuracy]], columns=comparison_df.columns)